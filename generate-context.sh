@@ -553,7 +553,9 @@ TOOLS_PYTHON=(
   "tools/pyproject.toml"
   "tools/README.md"
   "tools/uv.lock"
+  "tools/curve_params.py"
   "tools/debug_hints.py"
+  "tools/ed25519_hints.py"
   "tools/fix_compressed_points.py"
   "tools/garaga_conversion.py"
   "tools/generate_adaptor_hint.py"
@@ -20,6 +20,9 @@ Usage:
   
   # Run deployment
   uv run python3 scripts/deploy_with_starknet_py.py
+
+  # Probe RPC endpoints first and use the first one that answers
+  uv run python3 scripts/deploy_with_starknet_py.py --probe
   
 The script will compute the account address from the private key and prompt
 you to fund it before deploying the contract.
@@ -31,17 +34,28 @@ import os
 import sys
 from pathlib import Path
 
-try:
-    from starknet_py.contract import Contract
-    from starknet_py.net.account.account import Account
-    from starknet_py.net.full_node_client import FullNodeClient
-    from starknet_py.net.models import StarknetChainId
-    from starknet_py.net.signer.stark_curve_signer import KeyPair
-    from starknet_py.net.client_models import ResourceBounds, ResourceBoundsMapping
-except ImportError:
-    print("ERROR: starknet-py not installed")
-    print("Install with: uv pip install starknet-py")
-    sys.exit(1)
+
+def import_starknet_py():
+    """
+    Import starknet-py on first use.
+
+    Its modules take seconds to import, so main() only calls this once the
+    compiled contract files are known to exist.
+    """
+    global Contract, Account, FullNodeClient, StarknetChainId, KeyPair
+    global ResourceBounds, ResourceBoundsMapping
+    try:
+        from starknet_py.contract import Contract
+        from starknet_py.net.account.account import Account
+        from starknet_py.net.full_node_client import FullNodeClient
+        from starknet_py.net.models import StarknetChainId
+        from starknet_py.net.signer.stark_curve_signer import KeyPair
+        from starknet_py.net.client_models import ResourceBounds, ResourceBoundsMapping
+    except ImportError:
+        print("ERROR: starknet-py not installed")
+        print("Install with: uv pip install starknet-py")
+        sys.exit(1)
+
 
 # Configuration
 # Try multiple RPC endpoints for reliability
@@ -51,33 +65,137 @@ RPC_URLS = [
     "https://starknet-sepolia.g.alchemy.com/starknet/version/rpc/v0_7/cf52O0RwFy1mEB0uoYsel",
 ]
 RPC_URL = RPC_URLS[0]  # Default to Blast API (most reliable)
+RPC_PROBE_TIMEOUT = 3  # seconds per endpoint
+
+# OpenZeppelin account class hash (standard for Sepolia)
+OZ_ACCOUNT_CLASS_HASH = 0x01bd7c78bd731400989b0f6eb4f0e0b6e471f7b5ee0030f5bca87d1e4b61c0e
+
+# Paths
+REPO_ROOT = Path(__file__).resolve().parent.parent
+KEY_FILE = REPO_ROOT / ".deployer_key"
+CAIRO_DIR = REPO_ROOT / "cairo" / "target" / "dev"
+SIERRA_PATH = CAIRO_DIR / "atomic_lock_AtomicLock.contract_class.json"
+CASM_PATH = CAIRO_DIR / "atomic_lock_AtomicLock.compiled_contract_class.json"
+OUTPUT_PATH = REPO_ROOT / "deployments" / "starknet_py_result.json"
+
+
+async def probe_rpc(rpc_url):
+    """Create a client for rpc_url and check it answers get_chain_id."""
+    print(f"Trying RPC: {rpc_url}...")
+    client = FullNodeClient(node_url=rpc_url)
+    try:
+        chain_id = await asyncio.wait_for(client.get_chain_id(), timeout=RPC_PROBE_TIMEOUT)
+    except BaseException:
+        # Failed, timed out or cancelled: the caller never sees this client
+        await close_client(client)
+        raise
+    return client, rpc_url, chain_id
+
+
+async def close_client(client):
+    """
+    Close the aiohttp session held by a FullNodeClient, if any.
+
+    Clients built without a session open one per request and hold nothing
+    open between calls, so this is a no-op for them.
+    """
+    session = getattr(getattr(client, "_client", None), "session", None)
+    if session is not None and not session.closed:
+        await session.close()
 
-async def main():
+
+def cached_class_hash(sierra_path, sierra_compiled):
+    """
+    Compute the Sierra class hash, cached in a sidecar file.
+
+    The hash is deterministic in the file contents, so it is stored next to
+    the Sierra file keyed on its (mtime, size) and only recomputed after a
+    rebuild.
+    """
+    cache_path = sierra_path.with_suffix(".class_hash")
+    stat = sierra_path.stat()
+    key = [stat.st_mtime_ns, stat.st_size]
+
+    try:
+        cached = json.loads(cache_path.read_text())
+        if cached["key"] == key:
+            return int(cached["class_hash"], 16)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    from starknet_py.hash.class_hash import compute_class_hash
+    class_hash = compute_class_hash(json.loads(sierra_compiled))
+    try:
+        cache_path.write_text(json.dumps({"key": key, "class_hash": hex(class_hash)}))
+    except OSError as e:
+        print(f"⚠️ Could not cache class hash: {e}")
+    return class_hash
+
+
+async def main(probe=False):
+    # === 0. Locate Compiled Contract (before the slow starknet-py import) ===
+    sierra_path = SIERRA_PATH
+    casm_path = CASM_PATH
+    
+    if not sierra_path.exists():
+        print(f"❌ ERROR: Sierra file not found: {sierra_path}")
+        print("Run: cd cairo && scarb build")
+        return
+    
+    if not casm_path.exists():
+        print(f"❌ ERROR: CASM file not found: {casm_path}")
+        print("Run: cd cairo && scarb build")
+        return
+    
+    import_starknet_py()
+    
     # === 1. Setup Client and Account ===
     print("=== Connecting to Starknet Sepolia ===")
-    print(f"Using RPC: {RPC_URL}")
     
-    # Try to connect to RPC (simplified - just create client, test during actual operations)
-    client = None
-    for rpc_url in RPC_URLS:
-        try:
-            print(f"Trying RPC: {rpc_url}...")
+    # All endpoints are known Sepolia nodes, so skip the get_chain_id
+    # round-trip by default; declare_v3 fails fast if the RPC is down.
+    if not probe:
+        rpc_url = RPC_URL
+        client = FullNodeClient(node_url=rpc_url)
+    else:
+        # Probe all RPC endpoints concurrently and keep the first that answers,
+        # so a slow endpoint costs at most one timeout instead of adding up
+        client = None
+        losers = []
+        task_urls = {asyncio.create_task(probe_rpc(url)): url for url in RPC_URLS}
+        pending = set(task_urls)
+        while pending and client is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Collect every finished task, not just the first success
+            for task in done:
+                try:
+                    result = task.result()
+                except Exception as e:
+                    print(f"⚠️ Failed to connect to {task_urls[task]}: {str(e)[:100]}...")
+                    continue
+                if client is None:
+                    client, rpc_url, chain_id = result
+                    print(f"✅ Connected to {rpc_url} (Chain ID: {chain_id})")
+                else:
+                    losers.append(result[0])
+        
+        # Cancel the slower probes and wait for them to unwind
+        for task in pending:
+            task.cancel()
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, tuple):
+                losers.append(result[0])
+        for loser in losers:
+            await close_client(loser)
+        
+        if client is None:
+            print("❌ All RPC endpoints failed")
+            print("\nTrying to proceed anyway - RPC may work for actual operations...")
+            # Use the first RPC anyway - sometimes get_block fails but other operations work
+            rpc_url = RPC_URLS[0]
             client = FullNodeClient(node_url=rpc_url)
-            # Simple test - just try to get chain ID
-            chain_id = await client.get_chain_id()
-            print(f"✅ Connected to {rpc_url} (Chain ID: {chain_id})")
-            break
-        except Exception as e:
-            print(f"⚠️ Failed to connect to {rpc_url}: {str(e)[:100]}...")
-            if rpc_url != RPC_URLS[-1]:
-                print("Trying next RPC endpoint...")
-                continue
-            else:
-                print("❌ All RPC endpoints failed")
-                print("\nTrying to proceed anyway - RPC may work for actual operations...")
-                # Use the first RPC anyway - sometimes get_block fails but other operations work
-                client = FullNodeClient(node_url=RPC_URLS[0])
-                break
+    
+    print(f"Using RPC: {rpc_url}")
     
     if client is None:
         print("❌ Could not create RPC client")
@@ -88,8 +206,7 @@ async def main():
     # This avoids keystore password HMAC mismatch issues
     
     # Check for saved key file first
-    script_dir = Path(__file__).parent
-    key_file = script_dir.parent / ".deployer_key"
+    key_file = KEY_FILE
     
     PRIVATE_KEY = os.environ.get("STARKNET_PRIVATE_KEY", "").strip().replace("0x", "")
     
@@ -135,10 +252,6 @@ async def main():
         from starknet_py.net.account.account import compute_address
         from starknet_py.net.models import StarknetChainId
         
-        # Use OpenZeppelin account class hash (standard for Sepolia)
-        # This is the class hash for OpenZeppelin's Account contract
-        OZ_ACCOUNT_CLASS_HASH = 0x01bd7c78bd731400989b0f6eb4f0e0b6e471f7b5ee0030f5bca87d1e4b61c0e
-        
         # Compute address from public key (counterfactual)
         account_address = compute_address(
             class_hash=OZ_ACCOUNT_CLASS_HASH,
@@ -220,30 +333,13 @@ async def main():
         return
     
     # === 2. Load Compiled Contract ===
-    script_dir = Path(__file__).parent
-    cairo_dir = script_dir.parent / "cairo" / "target" / "dev"
-    
-    sierra_path = cairo_dir / "atomic_lock_AtomicLock.contract_class.json"
-    casm_path = cairo_dir / "atomic_lock_AtomicLock.compiled_contract_class.json"
-    
-    if not sierra_path.exists():
-        print(f"❌ ERROR: Sierra file not found: {sierra_path}")
-        print("Run: cd cairo && scarb build")
-        return
-    
-    if not casm_path.exists():
-        print(f"❌ ERROR: CASM file not found: {casm_path}")
-        print("Run: cd cairo && scarb build")
-        return
-    
     print(f"\n✅ Loaded Sierra: {sierra_path}")
     print(f"✅ Loaded CASM: {casm_path}")
     
-    with open(sierra_path, "r") as f:
-        sierra_compiled = f.read()
-    
-    with open(casm_path, "r") as f:
-        casm_compiled = f.read()
+    # starknet-py needs the classes as str; read raw bytes and decode once
+    # (skips text-mode newline translation on multi-MB JSON files)
+    sierra_compiled = sierra_path.read_bytes().decode("utf-8")
+    casm_compiled = casm_path.read_bytes().decode("utf-8")
     
     # === 3. Declare Contract ===
     print("\n=== Declaring contract... ===")
@@ -278,9 +374,7 @@ async def main():
         if "already declared" in error_str.lower():
             print("\n⚠️ Contract already declared, computing class hash...")
             try:
-                from starknet_py.hash.class_hash import compute_class_hash
-                sierra_json = json.loads(sierra_compiled)
-                class_hash = compute_class_hash(sierra_json)
+                class_hash = cached_class_hash(sierra_path, sierra_compiled)
                 print(f"✅ Class hash: {hex(class_hash)}")
             except Exception as compute_error:
                 print(f"❌ Failed to compute class hash: {compute_error}")
@@ -294,12 +388,12 @@ async def main():
     # === 4. Save Results ===
     result = {
         "class_hash": hex(class_hash),
-        "rpc_url": RPC_URL,
+        "rpc_url": rpc_url,
         "status": "declared",
         "account_address": hex(account.address),
     }
     
-    output_path = script_dir.parent / "deployments" / "starknet_py_result.json"
+    output_path = OUTPUT_PATH
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_path, "w") as f:
@@ -313,5 +407,13 @@ async def main():
     print("3. Deploy contract instance using the class hash and calldata")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    import argparse
+    parser = argparse.ArgumentParser(description="Declare AtomicLock on Starknet Sepolia")
+    parser.add_argument(
+        "--probe",
+        action="store_true",
+        help="Check RPC endpoints with get_chain_id and use the first that answers",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(probe=args.probe))
 
@@ -0,0 +1,63 @@
+"""
+Ed25519 curve parameters and modular arithmetic shared by the hint tools.
+
+Everything is evaluated once at import, so scripts importing these
+constants do not each pay for the inverse in D or the sqrt(-1) modexp.
+"""
+
+# gmpy2 (GMP-backed) powmod/invert is much faster than CPython ints;
+# fall back to built-in pow() when it is not installed.
+try:
+    import gmpy2
+    HAS_GMPY2 = True
+except ImportError:
+    HAS_GMPY2 = False
+
+# Field prime
+P = 2**255 - 19
+
+# Twisted Edwards d coefficient: -121665 / 121666 mod p
+D = -121665 * pow(121666, -1, P) % P
+
+# Prime order of the base point subgroup
+ED25519_ORDER = 2**252 + 27742317777372353535851937790883648493
+
+# Modular square root for Ed25519 (p ≡ 5 mod 8)
+I = pow(2, (P - 1) // 4, P)  # sqrt(-1) mod p
+SQRT_EXP = (P + 3) // 8  # exponent for sqrt(x)
+FUSED_SQRT_EXP = (P - 5) // 8  # exponent for the fused sqrt(u/v)
+
+
+def powmod(b, e, m):
+    """Modular exponentiation b^e mod m (gmpy2 when available)."""
+    if HAS_GMPY2:
+        return int(gmpy2.powmod(b, e, m))
+    return pow(b, e, m)
+
+
+def invert(v, m):
+    """Modular inverse of v mod m (gmpy2 when available)."""
+    if HAS_GMPY2:
+        return int(gmpy2.invert(v, m))
+    return pow(v, -1, m)
+
+
+def batch_invert(values, m):
+    """
+    Invert every value mod m with a single modular inverse (Montgomery's trick).
+    
+    Builds prefix products, inverts the total once, then sweeps backwards
+    recovering each inverse with two multiplications.
+    """
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        acc = (acc * v) % m
+    
+    inv = invert(acc, m)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        inverses[i] = (inv * prefix[i]) % m
+        inv = (inv * values[i]) % m
+    return inverses
@@ -9,14 +9,27 @@ This script checks:
 4. What Garaga will do with the hint
 """
 
-# Ed25519 field prime
-P = 0x7fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffed
+# Ed25519 field prime and d, plus the gmpy2-backed (batch) modular inverse
+from curve_params import D, P, batch_invert, invert
 
-# Ed25519 twisted Edwards curve parameter d
-D = 0x52036cee2b6ffe738cc740797779e89800700a4d4141d8ab75eb4dca135978a3
 
+def parse_compressed(compressed_hex: str):
+    """Split a compressed Ed25519 point into (sign_bit, y)."""
+    # Ed25519 compressed format: 32 bytes = 31 bytes (y-coordinate) + 1 byte (sign bit)
+    compressed = int.from_bytes(bytes.fromhex(compressed_hex.replace('0x', '')), 'little')
+    
+    # Extract sign bit (bit 255) and y-coordinate (bits 0-254)
+    return (compressed >> 255) & 1, compressed & ((1 << 255) - 1)
+
+
+def x_squared_fraction(y: int):
+    """Return (numerator, denominator) of x^2 = (y^2 - 1) / (d*y^2 + 1) mod P."""
+    y_sq = (y * y) % P
+    return (y_sq - 1) % P, (D * y_sq + 1) % P
 
-def debug_hint(compressed_hex: str, sqrt_hint_low: str, sqrt_hint_high: str):
+
+def debug_hint(compressed_hex: str, sqrt_hint_low: str, sqrt_hint_high: str,
+               x_squared_expected: int | None = None):
     """
     Debug a sqrt hint for a compressed Ed25519 point.
     
@@ -24,15 +37,11 @@ def debug_hint(compressed_hex: str, sqrt_hint_low: str, sqrt_hint_high: str):
         compressed_hex: Hex string of compressed point (32 bytes)
         sqrt_hint_low: Hex string of sqrt hint low u128
         sqrt_hint_high: Hex string of sqrt hint high u128
+        x_squared_expected: Precomputed x^2 (e.g. from a batch inversion);
+            computed here if omitted
     """
     # Parse compressed point
-    # Ed25519 compressed format: 32 bytes = 31 bytes (y-coordinate) + 1 byte (sign bit)
-    compressed_bytes = bytes.fromhex(compressed_hex.replace('0x', ''))
-    compressed = int.from_bytes(compressed_bytes, 'little')
-    
-    # Extract sign bit (bit 255) and y-coordinate (bits 0-254)
-    sign_bit = (compressed >> 255) & 1
-    y = compressed & ((1 << 255) - 1)
+    sign_bit, y = parse_compressed(compressed_hex)
     
     # Parse sqrt hint (reconstruct from low/high)
     hint_low = int(sqrt_hint_low.replace('0x', ''), 16)
@@ -40,10 +49,9 @@ def debug_hint(compressed_hex: str, sqrt_hint_low: str, sqrt_hint_high: str):
     sqrt_hint = hint_low + (hint_high << 128)
     
     # Compute expected x_squared
-    y_sq = (y * y) % P
-    numerator = (y_sq - 1) % P
-    denominator = (D * y_sq + 1) % P
-    x_squared_expected = (numerator * pow(denominator, -1, P)) % P
+    if x_squared_expected is None:
+        numerator, denominator = x_squared_fraction(y)
+        x_squared_expected = (numerator * invert(denominator, P)) % P
     
     # Check if sqrt_hint^2 matches
     hint_squared = (sqrt_hint * sqrt_hint) % P
@@ -81,7 +89,8 @@ def debug_hint(compressed_hex: str, sqrt_hint_low: str, sqrt_hint_high: str):
     # If parities don't match, Garaga will negate
     if hint_parity != (sign_bit % 2):
         negated = (-sqrt_hint) % P
-        negated_squared = (negated * negated) % P
+        # (-h)^2 == h^2 mod P, so reuse the square computed above
+        negated_squared = hint_squared
         print(f"\nAfter Garaga negates (parities don't match):")
         print(f"  negated hint: 0x{negated:064x}")
         print(f"  negated^2:    0x{negated_squared:064x}")
@@ -129,8 +138,15 @@ def main():
          "0x397c8b3280ddfb2ffe72518d79cc504c"),
     ]
     
-    for name, compressed, hint_low, hint_high in points:
-        debug_hint(compressed, hint_low, hint_high)
+    # Invert all four denominators at once instead of one inverse per hint
+    fractions = [x_squared_fraction(parse_compressed(compressed)[1])
+                 for _, compressed, _, _ in points]
+    inverses = batch_invert([den for _, den in fractions], P)
+    
+    for (name, compressed, hint_low, hint_high), (num, _), den_inv in zip(
+            points, fractions, inverses):
+        debug_hint(compressed, hint_low, hint_high,
+                   x_squared_expected=(num * den_inv) % P)
 
 
 if __name__ == "__main__":
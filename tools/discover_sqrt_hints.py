@@ -16,52 +16,33 @@ Usage: python discover_sqrt_hints.py <compressed_point_hex>
 import sys
 from pathlib import Path
 
-# Ed25519 field prime
-P = 2**255 - 19
+# Ed25519 field prime, d and sqrt(-1), plus gmpy2-backed powmod/invert
+from curve_params import SQRT_EXP, D, I, P, invert, powmod
 
-def tonelli_shanks_sqrt(n: int, p: int) -> int:
-    """Compute modular square root using Tonelli-Shanks."""
-    if pow(n, (p - 1) // 2, p) != 1:
-        return None  # No square root exists
-    
-    # Find Q and S such that p - 1 = Q * 2^S
-    Q = p - 1
-    S = 0
-    while Q % 2 == 0:
-        Q //= 2
-        S += 1
-    
-    # Find a quadratic non-residue
-    z = 2
-    while pow(z, (p - 1) // 2, p) != p - 1:
-        z += 1
-    
-    M = S
-    c = pow(z, Q, p)
-    t = pow(n, Q, p)
-    R = pow(n, (Q + 1) // 2, p)
+Y_MASK = (1 << 255) - 1  # compressed point without the sign bit
+
+def sqrt_mod_p(n: int) -> int:
+    """
+    Compute a modular square root mod the Ed25519 prime.
     
-    while True:
-        if t == 1:
-            return R
-        
-        # Find least i such that t^(2^i) = 1
-        i = 1
-        temp = (t * t) % p
-        while temp != 1:
-            temp = (temp * temp) % p
-            i += 1
-        
-        b = pow(c, 1 << (M - i - 1), p)
-        M = i
-        c = (b * b) % p
-        t = (t * c) % p
-        R = (R * b) % p
+    p = 2^255 - 19 is 5 mod 8, so n^((p+3)/8) is a root of n or of -n;
+    in the latter case multiplying by sqrt(-1) fixes it. No Tonelli-Shanks
+    loop is needed.
+    """
+    # Not JIT-compatible: Numba has no arbitrary-precision ints and the
+    # 255-bit modulus exceeds its int64 width; use gmpy2 for speed instead.
+    c = powmod(n, SQRT_EXP, P)
+    if (c * c - n) % P == 0:
+        return c
+    c = (c * I) % P
+    if (c * c - n) % P == 0:
+        return c
+    return None  # No square root exists
 
 def compressed_to_y(compressed_hex: str) -> int:
     """Extract y-coordinate from compressed Edwards point."""
     point_bytes = bytes.fromhex(compressed_hex.replace("0x", ""))
-    y = int.from_bytes(point_bytes, 'little') & ((1 << 255) - 1)
+    y = int.from_bytes(point_bytes, 'little') & Y_MASK
     return y
 
 def compute_candidate_sqrt_hints(compressed_hex: str) -> list:
@@ -73,20 +54,19 @@ def compute_candidate_sqrt_hints(compressed_hex: str) -> list:
     y = compressed_to_y(compressed_hex)
     
     # Edwards curve: x^2 = (y^2 - 1) / (d*y^2 + 1)
-    d = -121665 * pow(121666, -1, P) % P
-    
     numerator = (y * y - 1) % P
-    denominator = (d * y * y + 1) % P
+    denominator = (D * y * y + 1) % P
     
-    x_squared = (numerator * pow(denominator, -1, P)) % P
+    x_squared = (numerator * invert(denominator, P)) % P
     
     # Compute sqrt candidates
-    sqrt_candidate = tonelli_shanks_sqrt(x_squared, P)
+    sqrt_candidate = sqrt_mod_p(x_squared)
     if sqrt_candidate is None:
         return []
     
-    # Return both ±sqrt
-    candidates = [sqrt_candidate, P - sqrt_candidate]
+    # Return both ±sqrt (reduced mod p; a zero root has only one candidate)
+    neg_candidate = (P - sqrt_candidate) % P
+    candidates = [sqrt_candidate] if neg_candidate == sqrt_candidate else [sqrt_candidate, neg_candidate]
     
     # Format as u256
     results = []
@@ -95,8 +75,8 @@ def compute_candidate_sqrt_hints(compressed_hex: str) -> list:
         high = candidate >> 128
         results.append({
             "value": candidate,
-            "low": f"0x{low:032x}",
-            "high": f"0x{high:032x}"
+            "low": "0x" + low.to_bytes(16, "big").hex(),
+            "high": "0x" + high.to_bytes(16, "big").hex()
         })
     
     return results
@@ -0,0 +1,72 @@
+"""
+Pure-Python Ed25519 helpers for the hint tools.
+
+Point decompression (RFC 8032) and the integer-to-Cairo limb splits used
+by fix_all_hints.py. Needs no garaga import.
+"""
+
+from functools import lru_cache
+
+# Ed25519 curve parameters and gmpy2-backed powmod
+from curve_params import FUSED_SQRT_EXP, D, I, P, powmod
+
+MASK_96 = (1 << 96) - 1
+MASK_128 = (1 << 128) - 1
+Y_MASK = (1 << 255) - 1  # compressed point without the sign bit
+
+def decompress_edwards_point(compressed_hex: str) -> tuple[int, int]:
+    """
+    Decompress Edwards point from RFC 8032 format.
+    Returns (x, y) on twisted Edwards curve: -x² + y² = 1 + d·x²·y²
+    
+    Results are memoized on the normalized hex (no 0x prefix, lowercase).
+    """
+    return _decompress_edwards_point(compressed_hex.replace("0x", "").lower())
+
+@lru_cache(maxsize=128)
+def _decompress_edwards_point(compressed_hex: str) -> tuple[int, int]:
+    compressed_bytes = bytes.fromhex(compressed_hex)
+    compressed_int = int.from_bytes(compressed_bytes, 'little')
+    
+    # Extract sign bit (top bit of the last byte) and y-coordinate.
+    # One from_bytes + mask is ~2x faster than decoding two u128 halves.
+    sign_bit = compressed_bytes[31] >> 7
+    y = compressed_int & Y_MASK
+    
+    # x² = u / v with u = y² - 1, v = d·y² + 1
+    y2 = (y * y) % P
+    u = (y2 - 1) % P
+    v = (D * y2 + 1) % P
+    
+    # Fused sqrt + inverse (RFC 8032 §5.1.3): x = u·v³·(u·v⁷)^((p-5)/8),
+    # one exponentiation and no modular inverse
+    v3 = (v * v * v) % P
+    v7 = (v3 * v3 * v) % P
+    x = (u * v3 * powmod((u * v7) % P, FUSED_SQRT_EXP, P)) % P
+    vxx = (v * x * x) % P
+    if vxx != u:
+        if vxx != (P - u) % P:
+            raise ValueError(f"No square root for {hex(u)}/{hex(v)}")
+        x = (x * I) % P
+    
+    # Adjust sign per RFC 8032
+    x = x if (x & 1) == sign_bit else P - x
+    
+    return x, y
+
+def int_to_u256(value: int) -> dict:
+    """Convert integer to Cairo u256 {low, high} format."""
+    low = value & MASK_128
+    high = value >> 128
+    # to_bytes().hex() is a dedicated C routine, faster than f"{v:032x}"
+    return {"low": "0x" + low.to_bytes(16, "big").hex(),
+            "high": "0x" + high.to_bytes(16, "big").hex()}
+
+def int_to_u384_limbs(value: int) -> list[int]:
+    """Convert integer to 4 x 96-bit limbs for Garaga u384."""
+    return [
+        value & MASK_96,
+        (value >> 96) & MASK_96,
+        (value >> 192) & MASK_96,
+        (value >> 288) & MASK_96,
+    ]
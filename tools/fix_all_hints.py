@@ -11,66 +11,10 @@ import json
 import sys
 from pathlib import Path
 
-# Ed25519 curve parameters
-P = 2**255 - 19  # Field prime
-D = -121665 * pow(121666, -1, P) % P  # Twisted Edwards d coefficient
-ED25519_ORDER = 2**252 + 27742317777372353535851937790883648493
+# Ed25519 curve parameters and shared decompression helpers
+from curve_params import ED25519_ORDER
+from ed25519_hints import decompress_edwards_point, int_to_u256, int_to_u384_limbs
 
-# Modular square root for Ed25519 (p ≡ 5 mod 8)
-I = pow(2, (P - 1) // 4, P)  # sqrt(-1) mod p
-
-def sqrt_mod_p(x: int) -> int:
-    """Compute sqrt(x) mod p for Ed25519."""
-    # p = 2^255 - 19 ≡ 5 (mod 8), so use Tonelli-Shanks variant
-    candidate = pow(x, (P + 3) // 8, P)
-    if (candidate * candidate) % P == x % P:
-        return candidate
-    # Try multiplying by sqrt(-1)
-    candidate = (candidate * I) % P
-    if (candidate * candidate) % P == x % P:
-        return candidate
-    raise ValueError(f"No square root for {hex(x)}")
-
-def decompress_edwards_point(compressed_hex: str) -> tuple[int, int]:
-    """
-    Decompress Edwards point from RFC 8032 format.
-    Returns (x, y) on twisted Edwards curve: -x² + y² = 1 + d·x²·y²
-    """
-    compressed_bytes = bytes.fromhex(compressed_hex.replace("0x", ""))
-    compressed_int = int.from_bytes(compressed_bytes, 'little')
-    
-    # Extract sign bit (bit 255) and y-coordinate
-    sign_bit = (compressed_int >> 255) & 1
-    y = compressed_int & ((1 << 255) - 1)
-    
-    # Compute x² = (y² - 1) / (d·y² + 1) mod p
-    y2 = (y * y) % P
-    numerator = (y2 - 1) % P
-    denominator = (D * y2 + 1) % P
-    x2 = (numerator * pow(denominator, -1, P)) % P
-    
-    # Compute x = sqrt(x²)
-    x = sqrt_mod_p(x2)
-    
-    # Adjust sign per RFC 8032
-    if (x & 1) != sign_bit:
-        x = P - x
-    
-    return x, y
-
-def int_to_u256(value: int) -> dict:
-    """Convert integer to Cairo u256 {low, high} format."""
-    low = value & ((1 << 128) - 1)
-    high = value >> 128
-    return {"low": f"0x{low:032x}", "high": f"0x{high:032x}"}
-
-def int_to_u384_limbs(value: int) -> list[int]:
-    """Convert integer to 4 x 96-bit limbs for Garaga u384."""
-    MASK_96 = (1 << 96) - 1
-    return [
-        (value >> (96 * i)) & MASK_96
-        for i in range(4)
-    ]
 
 def point_add(x1: int, y1: int, x2: int, y2: int) -> tuple[int, int]:
     """Add two points on twisted Edwards curve."""
@@ -86,15 +30,13 @@ def point_multiply(x: int, y: int, scalar: int) -> tuple[int, int]:
     # For now, we'll need Garaga or a proper EC library
     raise NotImplementedError("Point multiplication needs Garaga or EC library")
 
-def get_fake_glv_hint(point_x: int, point_y: int, scalar: int) -> list[int]:
+def compute_scalar_parts(scalar: int) -> tuple[int, int]:
     """
-    Generate fake-GLV hint for Garaga MSM.
-    Format: [Q.x.limb0-3, Q.y.limb0-3, s1, s2_encoded]
-    
-    CRITICAL: Q = scalar * point, NOT just the point itself!
+    Split a scalar into the fake-GLV hint's (s1, s2_encoded) pair.
     
     The hint decomposes: scalar = s1 + s2 * lambda (mod order)
-    where lambda is the GLV endomorphism eigenvalue.
+    where lambda is the GLV endomorphism eigenvalue. Depends only on the
+    scalar, so compute it once per distinct scalar.
     """
     # GLV parameters for Ed25519 (from Garaga)
     LAMBDA = 0x5363ad4cc05c30e0a5261c028812645a122e22ea20816678df02967c1b23bd72
@@ -106,7 +48,15 @@ def get_fake_glv_hint(point_x: int, point_y: int, scalar: int) -> list[int]:
     
     # Encode s2 (Garaga uses signed encoding)
     s2_encoded = s2 if s2 >= 0 else (1 << 128) + s2
+    return s1, s2_encoded
+
+def assemble_hint(point_x: int, point_y: int, s1: int, s2_encoded: int) -> list[int]:
+    """
+    Build a fake-GLV hint from a point and precomputed scalar parts.
+    Format: [Q.x.limb0-3, Q.y.limb0-3, s1, s2_encoded]
     
+    CRITICAL: Q = scalar * point, NOT just the point itself!
+    """
     # CRITICAL: Q = scalar * point, not just the point!
     # We need to compute Q = scalar * (point_x, point_y)
     # For now, this is a placeholder - we need Garaga or proper EC library
@@ -120,6 +70,18 @@ def get_fake_glv_hint(point_x: int, point_y: int, scalar: int) -> list[int]:
     
     return x_limbs + y_limbs + [s1, s2_encoded]
 
+def get_fake_glv_hint(point_x: int, point_y: int, scalar: int) -> list[int]:
+    """
+    Generate fake-GLV hint for Garaga MSM.
+    Format: [Q.x.limb0-3, Q.y.limb0-3, s1, s2_encoded]
+    """
+    return assemble_hint(point_x, point_y, *compute_scalar_parts(scalar))
+
+def render_felt_array(name: str, values: list[int]) -> str:
+    """Render values as a Cairo `let name: Span<felt252> = array![...]` block."""
+    body = ",\n    ".join(f"0x{v:x}" for v in values)
+    return f"let {name}: Span<felt252> = array![\n    {body}\n].span();"
+
 def main():
     # Load test vectors
     vectors_path = Path(__file__).parent.parent / "rust" / "test_vectors.json"
@@ -130,115 +92,117 @@ def main():
     with open(vectors_path) as f:
         vectors = json.load(f)
     
-    print("=" * 80)
-    print("COMPLETE HINT REGENERATION")
-    print("=" * 80)
-    
-    # 1. Generate sqrt hints for all points
-    points = {
-        "adaptor_point": vectors["adaptor_point_compressed"],
-        "second_point": vectors["second_point_compressed"],
-        "r1": vectors["r1_compressed"],
-        "r2": vectors["r2_compressed"],
-    }
-    
-    decompressed = {}
-    sqrt_hints = {}
-    
-    print("\n### SQRT HINTS (for point decompression) ###\n")
-    
-    for name, compressed_hex in points.items():
-        x, y = decompress_edwards_point(compressed_hex)
-        decompressed[name] = (x, y)
-        sqrt_hints[name] = int_to_u256(x)
-        
-        const_name = name.upper().replace("_", "") + "_SQRT_HINT"
-        print(f"const TEST_{const_name}: u256 = u256 {{")
-        print(f"    low: {sqrt_hints[name]['low']},")
-        print(f"    high: {sqrt_hints[name]['high']},")
-        print(f"}};")
-        print()
-    
-    # 2. Generate MSM hints
-    print("\n### MSM HINTS (for Garaga msm_g1) ###\n")
-    
-    # Parse challenge and response from test vectors
-    challenge_hex = vectors["challenge"]
-    response_hex = vectors["response"]
-    
-    challenge_int = int(challenge_hex, 16)
-    response_int = int(response_hex, 16)
-    
-    # Cairo's reduce_felt_to_scalar truncates to 128 bits FIRST, then reduces mod order
-    # So we need to truncate first, then compute -c mod order
-    s_scalar = response_int & ((1 << 128) - 1)
-    c_scalar = challenge_int & ((1 << 128) - 1)
-    # Compute -c mod order, but the scalar stored in hint is the truncated value
-    # The actual MSM uses: (truncated_scalar) % order
-    # For the hint, we store the truncated scalar (128 bits), not the full mod order value
-    c_neg_scalar = (ED25519_ORDER - (c_scalar % ED25519_ORDER)) % ED25519_ORDER
-    # But Cairo truncates to 128 bits, so we need to use truncated value for hint storage
-    # However, the hint s1/s2 should match what Garaga expects
-    # Let's use the truncated value that fits in felt252
-    c_neg_scalar_for_hint = c_neg_scalar & ((1 << 128) - 1)
-    
-    print(f"// Scalars (after Cairo truncation):")
-    print(f"// s = 0x{s_scalar:032x}")
-    print(f"// c = 0x{c_scalar:032x}")
-    print(f"// -c (full) = 0x{c_neg_scalar:064x}")
-    print(f"// -c (truncated for hint) = 0x{c_neg_scalar_for_hint:032x}")
-    print()
-    
-    # G base point (RFC 8032)
-    G_compressed = "5866666666666666666666666666666666666666666666666666666666666666"
-    G_x, G_y = decompress_edwards_point(G_compressed)
-    
-    # Y = 2*G (second generator)
-    Y_compressed = vectors.get("y_compressed", "c9a3f86aae465f0e56513864510f3997561fa2c9e85ea21dc2292309f3cd6022")
-    Y_x, Y_y = decompress_edwards_point(Y_compressed)
-    
-    # T (adaptor point) and U (second point)
-    T_x, T_y = decompressed["adaptor_point"]
-    U_x, U_y = decompressed["second_point"]
-    
-    # Generate all 4 MSM hints
-    # Note: For c_neg hints, we use the truncated scalar that fits in felt252
-    # The actual MSM computation will reduce mod order, but the hint stores the truncated value
-    hints = {
-        "s_hint_for_g": get_fake_glv_hint(G_x, G_y, s_scalar),
-        "s_hint_for_y": get_fake_glv_hint(Y_x, Y_y, s_scalar),
-        "c_neg_hint_for_t": get_fake_glv_hint(T_x, T_y, c_neg_scalar_for_hint),
-        "c_neg_hint_for_u": get_fake_glv_hint(U_x, U_y, c_neg_scalar_for_hint),
-    }
-    
-    for hint_name, hint_values in hints.items():
-        print(f"let {hint_name}: Span<felt252> = array![")
-        for i, v in enumerate(hint_values):
-            comma = "," if i < 9 else ""
-            print(f"    0x{v:x}{comma}")
-        print("].span();")
-        print()
-    
-    # 3. Generate fake_glv_hint for adaptor point (used in constructor)
-    print("\n### FAKE_GLV_HINT (for adaptor point in constructor) ###\n")
-    
-    # This hint is for scalar * T verification
-    # The scalar comes from the revealed secret
-    secret_hex = vectors["secret"]
-    secret_int = int(secret_hex, 16)
-    secret_scalar = secret_int % ED25519_ORDER
-    
-    adaptor_hint = get_fake_glv_hint(T_x, T_y, secret_scalar)
-    
-    print(f"let fake_glv_hint: Span<felt252> = array![")
-    for i, v in enumerate(adaptor_hint):
-        comma = "," if i < 9 else ""
-        print(f"    0x{v:x}{comma}")
-    print("].span();")
-    
-    print("\n" + "=" * 80)
-    print("Copy the above constants into cairo/tests/test_e2e_dleq.cairo")
-    print("=" * 80)
+    # Collect output and write it once at the end instead of per-line
+    # prints; flush in finally so partial output survives a failure
+    out = []
+    emit = out.append
+    try:
+        emit("=" * 80)
+        emit("COMPLETE HINT REGENERATION")
+        emit("=" * 80)
+        
+        # 1. Generate sqrt hints for all points
+        points = (
+            ("adaptor_point", vectors["adaptor_point_compressed"]),
+            ("second_point", vectors["second_point_compressed"]),
+            ("r1", vectors["r1_compressed"]),
+            ("r2", vectors["r2_compressed"]),
+        )
+        
+        decompressed = {}
+        sqrt_hints = {}
+        
+        emit("\n### SQRT HINTS (for point decompression) ###\n")
+        
+        for name, compressed_hex in points:
+            x, y = decompress_edwards_point(compressed_hex)
+            decompressed[name] = (x, y)
+            sqrt_hints[name] = int_to_u256(x)
+            
+            const_name = name.upper().replace("_", "") + "_SQRT_HINT"
+            emit(f"const TEST_{const_name}: u256 = u256 {{")
+            emit(f"    low: {sqrt_hints[name]['low']},")
+            emit(f"    high: {sqrt_hints[name]['high']},")
+            emit(f"}};")
+            emit("")
+        
+        # 2. Generate MSM hints
+        emit("\n### MSM HINTS (for Garaga msm_g1) ###\n")
+        
+        # Parse challenge and response from test vectors
+        challenge_hex = vectors["challenge"]
+        response_hex = vectors["response"]
+        
+        challenge_int = int(challenge_hex, 16)
+        response_int = int(response_hex, 16)
+        
+        # Cairo's reduce_felt_to_scalar truncates to 128 bits FIRST, then reduces mod order
+        # So we need to truncate first, then compute -c mod order
+        s_scalar = response_int & ((1 << 128) - 1)
+        c_scalar = challenge_int & ((1 << 128) - 1)
+        # Compute -c mod order, but the scalar stored in hint is the truncated value
+        # The actual MSM uses: (truncated_scalar) % order
+        # For the hint, we store the truncated scalar (128 bits), not the full mod order value
+        c_neg_scalar = (ED25519_ORDER - (c_scalar % ED25519_ORDER)) % ED25519_ORDER
+        # But Cairo truncates to 128 bits, so we need to use truncated value for hint storage
+        # However, the hint s1/s2 should match what Garaga expects
+        # Let's use the truncated value that fits in felt252
+        c_neg_scalar_for_hint = c_neg_scalar & ((1 << 128) - 1)
+        
+        emit(f"// Scalars (after Cairo truncation):")
+        emit(f"// s = 0x{s_scalar:032x}")
+        emit(f"// c = 0x{c_scalar:032x}")
+        emit(f"// -c (full) = 0x{c_neg_scalar:064x}")
+        emit(f"// -c (truncated for hint) = 0x{c_neg_scalar_for_hint:032x}")
+        emit("")
+        
+        # G base point (RFC 8032)
+        G_compressed = "5866666666666666666666666666666666666666666666666666666666666666"
+        G_x, G_y = decompress_edwards_point(G_compressed)
+        
+        # Y = 2*G (second generator)
+        Y_compressed = vectors.get("y_compressed", "c9a3f86aae465f0e56513864510f3997561fa2c9e85ea21dc2292309f3cd6022")
+        Y_x, Y_y = decompress_edwards_point(Y_compressed)
+        
+        # T (adaptor point) and U (second point)
+        T_x, T_y = decompressed["adaptor_point"]
+        U_x, U_y = decompressed["second_point"]
+        
+        # Generate all 4 MSM hints
+        # Note: For c_neg hints, we use the truncated scalar that fits in felt252
+        # The actual MSM computation will reduce mod order, but the hint stores the truncated value
+        # Only two distinct scalars: split each once, reuse for both points
+        s_parts = compute_scalar_parts(s_scalar)
+        c_neg_parts = compute_scalar_parts(c_neg_scalar_for_hint)
+        hints = (
+            ("s_hint_for_g", assemble_hint(G_x, G_y, *s_parts)),
+            ("s_hint_for_y", assemble_hint(Y_x, Y_y, *s_parts)),
+            ("c_neg_hint_for_t", assemble_hint(T_x, T_y, *c_neg_parts)),
+            ("c_neg_hint_for_u", assemble_hint(U_x, U_y, *c_neg_parts)),
+        )
+        
+        for hint_name, hint_values in hints:
+            emit(render_felt_array(hint_name, hint_values))
+            emit("")
+        
+        # 3. Generate fake_glv_hint for adaptor point (used in constructor)
+        emit("\n### FAKE_GLV_HINT (for adaptor point in constructor) ###\n")
+        
+        # This hint is for scalar * T verification
+        # The scalar comes from the revealed secret
+        secret_hex = vectors["secret"]
+        secret_int = int(secret_hex, 16)
+        secret_scalar = secret_int % ED25519_ORDER
+        
+        adaptor_hint = get_fake_glv_hint(T_x, T_y, secret_scalar)
+        
+        emit(render_felt_array("fake_glv_hint", adaptor_hint))
+        
+        emit("\n" + "=" * 80)
+        emit("Copy the above constants into cairo/tests/test_e2e_dleq.cairo")
+        emit("=" * 80)
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,7 @@ This script correctly converts hex strings to u256 structures.
 """
 
 import json
+import sys
 from pathlib import Path
 
 
@@ -62,52 +63,59 @@ def main():
     with open(test_vectors_path, 'r') as f:
         vectors = json.load(f)
     
-    print("=" * 80)
-    print("Converting Compressed Points from Hex Strings to u256")
-    print("=" * 80)
-    print()
-    print("Root Cause: Hex strings represent LITTLE-ENDIAN bytes per RFC 8032")
-    print("We must use int.from_bytes(bytes, byteorder='little') to convert correctly.")
-    print()
-    
-    # Points to convert
-    points_to_convert = [
-        'adaptor_point_compressed',
-        'second_point_compressed',
-        'r1_compressed',
-        'r2_compressed',
-        'g_compressed',
-        'y_compressed',
-    ]
-    
-    results = {}
-    
-    for point_name in points_to_convert:
-        if point_name in vectors:
-            hex_str = vectors[point_name]
-            print(f"{point_name}:")
-            print(f"  Original hex: {hex_str}")
-            
-            try:
-                result = fix_compressed_point_to_u256(hex_str)
-                results[point_name] = result
+    # Collect output and write it once at the end instead of per-line
+    # prints; flush in finally so partial output survives a failure
+    out = []
+    emit = out.append
+    try:
+        emit("=" * 80)
+        emit("Converting Compressed Points from Hex Strings to u256")
+        emit("=" * 80)
+        emit("")
+        emit("Root Cause: Hex strings represent LITTLE-ENDIAN bytes per RFC 8032")
+        emit("We must use int.from_bytes(bytes, byteorder='little') to convert correctly.")
+        emit("")
+        
+        # Points to convert
+        points_to_convert = [
+            'adaptor_point_compressed',
+            'second_point_compressed',
+            'r1_compressed',
+            'r2_compressed',
+            'g_compressed',
+            'y_compressed',
+        ]
+        
+        results = {}
+        
+        for point_name in points_to_convert:
+            if point_name in vectors:
+                hex_str = vectors[point_name]
+                emit(f"{point_name}:")
+                emit(f"  Original hex: {hex_str}")
                 
-                print(f"  Cairo u256:")
-                print(f"    {result['cairo_format']}")
-                print()
-            except Exception as e:
-                print(f"  ERROR: {e}")
-                print()
-    
-    print("=" * 80)
-    print("Summary - Copy these values into your Cairo test files:")
-    print("=" * 80)
-    print()
-    
-    for point_name, result in results.items():
-        const_name = point_name.upper().replace('_COMPRESSED', '')
-        print(f"const TEST_{const_name}: u256 = {result['cairo_format']};")
-        print()
+                try:
+                    result = fix_compressed_point_to_u256(hex_str)
+                    results[point_name] = result
+                    
+                    emit(f"  Cairo u256:")
+                    emit(f"    {result['cairo_format']}")
+                    emit("")
+                except Exception as e:
+                    emit(f"  ERROR: {e}")
+                    emit("")
+        
+        emit("=" * 80)
+        emit("Summary - Copy these values into your Cairo test files:")
+        emit("=" * 80)
+        emit("")
+        
+        for point_name, result in results.items():
+            const_name = point_name.upper().replace('_COMPRESSED', '')
+            emit(f"const TEST_{const_name}: u256 = {result['cairo_format']};")
+            emit("")
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -5,16 +5,45 @@ Based on auditor's recommendation - uses standard p = 2^255 - 19 arithmetic.
 """
 
 import json
+from functools import lru_cache
 
-# Ed25519 field prime
-p = 2**255 - 19
+# Ed25519 field prime, d, sqrt(-1) and gmpy2-backed powmod
+from curve_params import FUSED_SQRT_EXP, HAS_GMPY2, D, I, P, powmod
 
-# Ed25519 curve parameter d
-d = -121665 * pow(121666, -1, p) % p
 
-# Square root of -1 mod p (for computing square roots)
-I = pow(2, (p - 1) // 4, p)
+def _sqn(x, n):
+    """x^(2^n) mod p by n repeated squarings."""
+    for _ in range(n):
+        x = (x * x) % P
+    return x
+
 
+def pow_p58(z):
+    """
+    Compute z^((p-5)/8) = z^(2^252 - 3) mod p.
+    
+    Uses the fixed curve25519 addition chain (ref10 pow22523): 252
+    squarings and 11 multiplications, versus ~50 extra multiplications for
+    generic windowed pow(). gmpy2's C powmod is faster still, so prefer it.
+    """
+    if HAS_GMPY2:
+        return powmod(z, FUSED_SQRT_EXP, P)
+    
+    z2 = (z * z) % P
+    z9 = (z * _sqn(z2, 2)) % P
+    z11 = (z2 * z9) % P
+    z_5_0 = (z9 * z11 * z11) % P              # z^(2^5 - 1)
+    z_10_0 = (_sqn(z_5_0, 5) * z_5_0) % P     # z^(2^10 - 1)
+    z_20_0 = (_sqn(z_10_0, 10) * z_10_0) % P
+    z_40_0 = (_sqn(z_20_0, 20) * z_20_0) % P
+    z_50_0 = (_sqn(z_40_0, 10) * z_10_0) % P
+    z_100_0 = (_sqn(z_50_0, 50) * z_50_0) % P
+    z_200_0 = (_sqn(z_100_0, 100) * z_100_0) % P
+    z_250_0 = (_sqn(z_200_0, 50) * z_50_0) % P  # z^(2^250 - 1)
+    return (_sqn(z_250_0, 2) * z) % P             # z^(2^252 - 3)
+
+
+@lru_cache(maxsize=1024)
 def recover_x(y):
     """
     Recover x-coordinate from y-coordinate on Ed25519 curve.
@@ -24,28 +53,27 @@ def recover_x(y):
     """
     y = int(y)
     
-    # x^2 = (y^2 - 1) / (d*y^2 + 1)
-    u = (y*y - 1) % p
-    v = (d*y*y + 1) % p
-    v_inv = pow(v, -1, p)
-    x2 = (u * v_inv) % p
-    
-    # Square root using Tonelli-Shanks-like method
-    # For Ed25519: x = x2^((p+3)/8) mod p
-    x = pow(x2, (p + 3) // 8, p)
+    # x^2 = u / v with u = y^2 - 1, v = d*y^2 + 1
+    u = (y*y - 1) % P
+    v = (D*y*y + 1) % P
     
-    # Verify and adjust if needed
-    if (x * x) % p != x2:
-        x = (x * I) % p
+    # Fused sqrt + inverse (RFC 8032 §5.1.3), valid since p = 5 mod 8:
+    # x = u*v^3 * (u*v^7)^((p-5)/8), a single exponentiation and no inverse
+    v3 = (v * v * v) % P
+    v7 = (v3 * v3 * v) % P
+    x = (u * v3 * pow_p58((u * v7) % P)) % P
     
-    if (x * x) % p != x2:
-        raise ValueError(f"No square root found! x^2 = {hex(x2)}")
+    # Select the root: x is correct if v*x^2 == u, otherwise x*sqrt(-1)
+    x = x if (v * x * x) % P == u else (x * I) % P
     
     # In Ed25519, x is usually even for the positive sqrt,
     # but Garaga might expect the specific root corresponding to the sign bit.
     # For test vectors, usually the positive (even) x is canonical unless sign bit is set.
-    if x % 2 != 0:
-        x = p - x
+    x = P - x if x & 1 else x
+    
+    # Single validity check (u/v was not a square if this fails)
+    if (v * x * x) % P != u:
+        raise ValueError(f"No square root found! u/v = {hex(u)}/{hex(v)}")
     
     return x
 
@@ -56,6 +84,14 @@ def hex_to_u256_little_endian(value_int):
     high = (value_int >> 128) & ((1 << 128) - 1)
     return low, high
 
+# Cairo constant emitted per point (one print instead of one per line)
+POINT_TEMPLATE = """// {name} (compressed: {hex})
+const {name}_SQRT_HINT: u256 = u256 {{
+    low: 0x{low:032x},
+    high: 0x{high:032x},
+}};
+"""
+
 # Load test vectors
 try:
     with open('rust/test_vectors.json', 'r') as f:
@@ -74,29 +110,24 @@ try:
         ("TEST_R2", data['r2_compressed']),
     ]
     
+    # First pass: decode every compressed point to its y-coordinate
+    ys = []
     for name, point_hex in points:
-        # Parse hex string to bytes
-        point_bytes = bytes.fromhex(point_hex)
-        
-        # Convert to integer (little-endian as per Ed25519)
-        y_int = int.from_bytes(point_bytes, byteorder='little')
-        
-        # Extract sign bit (bit 255) and y-coordinate
-        sign_bit = (y_int >> 255) & 1
-        y_coordinate = y_int & ((1 << 255) - 1)
-        
-        # Recover x-coordinate
-        x_coordinate = recover_x(y_coordinate)
+        # Parse hex string as a little-endian integer (as per Ed25519)
+        y_int = int.from_bytes(bytes.fromhex(point_hex), byteorder='little')
         
+        # Extract y-coordinate (bit 255 is the sign bit)
+        ys.append(y_int & ((1 << 255) - 1))
+    
+    # Second pass: recover x-coordinates. The fused sqrt in recover_x needs
+    # no inverse, so there is nothing left to share via batch inversion.
+    xs = [recover_x(y) for y in ys]
+    
+    for (name, point_hex), x_coordinate in zip(points, xs):
         # Convert to u256 format
         x_low, x_high = hex_to_u256_little_endian(x_coordinate)
         
-        print(f"// {name} (compressed: {point_hex})")
-        print(f"const {name}_SQRT_HINT: u256 = u256 {{")
-        print(f"    low: 0x{x_low:032x},")
-        print(f"    high: 0x{x_high:032x},")
-        print(f"}};")
-        print()
+        print(POINT_TEMPLATE.format(name=name, hex=point_hex, low=x_low, high=x_high))
         
 except FileNotFoundError:
     print("Error: rust/test_vectors.json not found")
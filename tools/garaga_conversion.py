@@ -6,6 +6,9 @@ This module provides functions to convert compressed Edwards points
 from hex strings to Cairo u256 format, matching Garaga's exact pattern.
 """
 
+from functools import cache
+
+
 def bytes_to_u256_garaga_style(bytes_32: bytes) -> dict:
     """
     Convert 32-byte compressed Edwards point to u256 using Garaga's pattern.
@@ -38,7 +41,7 @@ def bytes_to_u256_garaga_style(bytes_32: bytes) -> dict:
     
     return {
         "int": int_value,
-        "hex": f"0x{int_value:064x}",
+        "hex": "0x" + int_value.to_bytes(32, "big").hex(),
         "cairo_u256": f"u256 {{ low: 0x{low:x}, high: 0x{high:x} }}",
         "low": hex(low),
         "high": hex(high),
@@ -50,15 +53,23 @@ def hex_string_to_u256_garaga_style(hex_string: str) -> dict:
     """
     Convert hex string (compressed Edwards point) to u256 using Garaga's pattern.
     
+    Conversions are memoized on the normalized hex string, so repeated
+    verification passes over the same test vectors skip the decode.
+    
     Args:
         hex_string: Hex string (with or without 0x prefix)
     
     Returns:
         Dictionary with conversion results (same format as bytes_to_u256_garaga_style)
     """
-    # Remove 0x prefix if present
-    hex_string = hex_string.replace('0x', '')
+    # Remove 0x prefix if present; normalize case for the cache key
+    hex_string = hex_string.replace('0x', '').lower()
     
+    # Return a copy so callers cannot mutate the cached result
+    return dict(_hex_string_to_u256_cached(hex_string))
+
+@cache
+def _hex_string_to_u256_cached(hex_string: str) -> dict:
     # Convert hex string to bytes
     bytes_32 = bytes.fromhex(hex_string)
     
@@ -11,23 +11,6 @@ This script:
 3. Generates fake-GLV hint with Q = adaptor_point
 """
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for garaga
-sys.path.insert(0, str(Path(__file__).parent))
-
-try:
-    from garaga.curves import CurveID
-    from garaga.points import G1Point
-    from garaga.hints.fake_glv import get_fake_glv_hint
-    from garaga.signatures.eddsa_25519 import decompress_edwards_pt_from_y_compressed_le_into_weirstrass_point
-except ImportError:
-    print("Error: garaga package not found")
-    print("Install with: pip install garaga")
-    sys.exit(1)
-
-
 def u384_to_cairo_tuple(value) -> tuple:
     """Convert u384 to Cairo tuple format (4×96-bit limbs)."""
     mask_96 = (1 << 96) - 1
@@ -45,7 +28,7 @@ def generate_adaptor_hint(adaptor_compressed_hex: str, sqrt_hint_low: str, sqrt_
     The hint Q must equal the decompressed adaptor point.
     We generate a hint for scalar * G = adaptor_point, where Q = adaptor_point.
     """
-    # Parse compressed point and sqrt hint
+    # Parse compressed point and sqrt hint once, then hand off to the int path
     adaptor_bytes = bytes.fromhex(adaptor_compressed_hex.replace('0x', ''))
     adaptor_u256 = int.from_bytes(adaptor_bytes, 'little')
     
@@ -53,15 +36,25 @@ def generate_adaptor_hint(adaptor_compressed_hex: str, sqrt_hint_low: str, sqrt_
     sqrt_high = int(sqrt_hint_high.replace('0x', ''), 16)
     sqrt_hint_u256 = sqrt_low + (sqrt_high << 128)
     
-    # Decompress adaptor point using Garaga
-    # Note: This requires the Python garaga library to have the decompression function
-    # For now, we'll need to use a workaround
+    generate_adaptor_hint_int(adaptor_u256, sqrt_hint_u256)
+
+
+def generate_adaptor_hint_int(adaptor_u256: int, sqrt_hint_u256: int):
+    """
+    Generate fake-GLV hint for adaptor point from already-parsed integers.
+    
+    Args:
+        adaptor_u256: Compressed adaptor point as a little-endian integer
+        sqrt_hint_u256: Sqrt hint as an integer (low + high << 128)
+    """
+    sqrt_low = sqrt_hint_u256 & ((1 << 128) - 1)
+    sqrt_high = sqrt_hint_u256 >> 128
     
     print("=" * 80)
     print("Generating Fake-GLV Hint for Adaptor Point")
     print("=" * 80)
     print()
-    print(f"Adaptor point compressed: {adaptor_compressed_hex}")
+    print(f"Adaptor point compressed: {adaptor_u256.to_bytes(32, 'little').hex()}")
     print(f"Sqrt hint: low=0x{sqrt_low:032x}, high=0x{sqrt_high:032x}")
     print()
     print("NOTE: This requires decompressing the adaptor point first.")
@@ -6,6 +6,10 @@ This script generates the correct s1/s2 decomposition for the scalar
 used in MSM verification: scalar·G == adaptor_point
 
 The scalar is derived from SHA-256(secret) → hashlock → u256 → mod Ed25519 order.
+
+Curve constants (order, generator) are resolved once at import, so the
+functions below can be imported and called in a loop without re-paying
+the garaga curve lookup.
 """
 
 import json
@@ -27,6 +31,13 @@ except ImportError:
     print("  uv pip install --python 3.10 garaga==1.0.1")
     sys.exit(1)
 
+_ED25519 = CURVES[CurveID.ED25519.value]
+_ED25519_ORDER = _ED25519.n  # Curve order is stored as 'n'
+_GX = _ED25519.Gx
+_GY = _ED25519.Gy
+_G = G1Point.get_nG(CurveID.ED25519, 1)  # Ed25519 generator G (Weierstrass point)
+_MASK_96 = (1 << 96) - 1
+
 
 def secret_to_scalar(secret_bytes: bytes) -> int:
     """
@@ -37,28 +48,30 @@ def secret_to_scalar(secret_bytes: bytes) -> int:
     
     This matches Rust's Scalar::from_bytes_mod_order() behavior.
     """
-    # Convert bytes to u32 words (little-endian)
-    words = []
-    for i in range(0, 32, 4):
-        word = int.from_bytes(secret_bytes[i:i+4], byteorder='little')
-        words.append(word)
-    
-    # Build u256: s0 + s1·2^32 + s2·2^64 + ... + s7·2^224
-    scalar = 0
-    for i, word in enumerate(words):
-        scalar += word * (2 ** (32 * i))
-    
-    # Reduce mod Ed25519 order
-    curve = CURVES[CurveID.ED25519.value]
-    ed25519_order = curve.n  # Curve order is stored as 'n'
-    scalar = scalar % ed25519_order
-    
-    return scalar
+    # Little-endian u32 words s0 + s1·2^32 + ... + s7·2^224 are exactly
+    # the little-endian reading of the 32 bytes
+    return int.from_bytes(secret_bytes, 'little') % _ED25519_ORDER
+
+
+def _u384_to_limbs(value: int) -> list[int]:
+    """Convert u384 to 4 u96 limbs."""
+    return [
+        value & _MASK_96,
+        (value >> 96) & _MASK_96,
+        (value >> 192) & _MASK_96,
+        (value >> 288) & _MASK_96,
+    ]
+
+
+def _quiet(*args, **kwargs):
+    """Drop diagnostic output when not running with --verbose."""
 
 
 def generate_adaptor_point_hint(
     test_vectors_path: str = "../rust/test_vectors.json",
-    output_path: str = "../cairo/adaptor_point_hint.json"
+    output_path: str = "../cairo/adaptor_point_hint.json",
+    verify: bool = False,
+    verbose: bool = False,
 ):
     """
     Generate fake-GLV hint for adaptor point MSM: scalar·G == adaptor_point
@@ -66,7 +79,11 @@ def generate_adaptor_point_hint(
     Args:
         test_vectors_path: Path to test_vectors.json containing hashlock and adaptor point
         output_path: Path to save generated hint
+        verify: Recompute scalar·G independently and check it against Q
+        verbose: Print intermediate values (scalar, G, Q, hint breakdown)
     """
+    log = print if verbose else _quiet
+    
     # Load test vectors
     with open(test_vectors_path, 'r') as f:
         vectors = json.load(f)
@@ -83,100 +100,73 @@ def generate_adaptor_point_hint(
     # Convert secret to scalar (matching how Rust generates adaptor point)
     # Secret is interpreted as little-endian bytes → scalar mod order
     secret_int = int.from_bytes(secret_bytes, 'little')
-    curve = CURVES[CurveID.ED25519.value]
-    ed25519_order = curve.n
-    scalar = secret_int % ed25519_order
+    scalar = secret_int % _ED25519_ORDER
     
-    print(f"Secret: {secret_hex}")
-    print(f"Secret scalar: {hex(scalar)}")
-    print(f"Scalar (decimal): {scalar}")
-    print(f"\nNote: Adaptor point is generated from SECRET scalar, not hashlock scalar")
-    print(f"Protocol: adaptor_point = secret·G, verify: secret·G == adaptor_point")
+    log(f"Secret: {secret_hex}")
+    log(f"Secret scalar: {hex(scalar)}")
+    log(f"Scalar (decimal): {scalar}")
+    log(f"\nNote: Adaptor point is generated from SECRET scalar, not hashlock scalar")
+    log(f"Protocol: adaptor_point = secret·G, verify: secret·G == adaptor_point")
     
     # Get Ed25519 generator G (Weierstrass coordinates)
-    curve = CURVES[CurveID.ED25519.value]
-    G_x = curve.Gx
-    G_y = curve.Gy
-    
-    print(f"\nEd25519 Generator G:")
-    print(f"  G.x: {hex(G_x)}")
-    print(f"  G.y: {hex(G_y)}")
-    
-    # Extract adaptor point coordinates from test vectors
-    # The adaptor point is stored as compressed Edwards, we need to decompress it
-    # For now, we'll use Garaga's decompression
-    adaptor_compressed_hex = vectors['adaptor_point_compressed']
-    if isinstance(adaptor_compressed_hex, str):
-        adaptor_compressed_hex = adaptor_compressed_hex.replace('0x', '')
-        adaptor_compressed_bytes = bytes.fromhex(adaptor_compressed_hex)
-    else:
-        # Convert u256 to bytes (little-endian)
-        adaptor_compressed_bytes = adaptor_compressed_hex.to_bytes(32, 'little')
-    
-    # Get Ed25519 generator G (Weierstrass point)
-    G = G1Point.get_nG(CurveID.ED25519, 1)
+    G_x = _GX
+    G_y = _GY
     
-    # Compute adaptor_point = scalar·G (this is what we're verifying)
-    adaptor_point = G.scalar_mul(scalar)
+    log(f"\nEd25519 Generator G:")
+    log(f"  G.x: {hex(G_x)}")
+    log(f"  G.y: {hex(G_y)}")
     
-    print(f"\nSecret scalar (from secret bytes):")
-    print(f"  0x{scalar:064x}")
+    G = _G
     
-    print(f"\nAdaptor point (computed from scalar·G):")
-    print(f"  x: {hex(adaptor_point.x)}")
-    print(f"  y: {hex(adaptor_point.y)}")
+    log(f"\nSecret scalar (from secret bytes):")
+    log(f"  0x{scalar:064x}")
     
     # Generate fake-GLV hint using Garaga's get_fake_glv_hint
     # This generates correct s1/s2 decomposition satisfying s2·scalar ≡ s1 (mod r)
     # NOTE: scalar is derived from SECRET, not hashlock (per auditor recommendation)
-    print(f"\nGenerating fake-GLV hint using get_fake_glv_hint...")
+    log(f"\nGenerating fake-GLV hint using get_fake_glv_hint...")
     Q, s1, s2_encoded = get_fake_glv_hint(G, scalar)
     
-    # Verify Q matches adaptor_point
-    assert Q == adaptor_point, f"Q mismatch: {Q} != {adaptor_point}"
-    print(f"✓ Q matches adaptor_point (secret·G)")
+    # get_fake_glv_hint already returns Q = scalar·G
+    log(f"\nAdaptor point (Q = scalar·G):")
+    log(f"  x: {hex(Q.x)}")
+    log(f"  y: {hex(Q.y)}")
+    
+    if verify:
+        # Independent scalar multiplication (one extra 256-bit EC mul)
+        adaptor_point = G.scalar_mul(scalar)
+        assert Q == adaptor_point, f"Q mismatch: {Q} != {adaptor_point}"
+        print(f"✓ Q matches adaptor_point (secret·G)")
     
     # Convert Q coordinates to u384 limbs (4×96-bit limbs each)
-    def u384_to_limbs(value: int) -> list[int]:
-        """Convert u384 to 4 u96 limbs."""
-        mask_96 = (1 << 96) - 1
-        return [
-            value & mask_96,
-            (value >> 96) & mask_96,
-            (value >> 192) & mask_96,
-            (value >> 288) & mask_96,
-        ]
-    
-    Q_x_limbs = u384_to_limbs(Q.x)
-    Q_y_limbs = u384_to_limbs(Q.y)
+    Q_x_limbs = _u384_to_limbs(Q.x)
+    Q_y_limbs = _u384_to_limbs(Q.y)
     
     # Build hint: [Q.x[4], Q.y[4], s1, s2_encoded]
     hint = [*Q_x_limbs, *Q_y_limbs, s1, s2_encoded]
     
-    print(f"\nGenerated hint (10 felts):")
-    for i, felt in enumerate(hint):
-        print(f"  hint[{i}]: 0x{felt:x}")
-    
-    print(f"\nHint breakdown:")
-    print(f"  Q.x limbs: {[hex(x) for x in Q_x_limbs]}")
-    print(f"  Q.y limbs: {[hex(y) for y in Q_y_limbs]}")
-    print(f"  s1: 0x{s1:x}")
-    print(f"  s2_encoded: 0x{s2_encoded:x}")
+    if verbose:
+        print(f"\nGenerated hint (10 felts):")
+        for i, felt in enumerate(hint):
+            print(f"  hint[{i}]: 0x{felt:x}")
+        
+        print(f"\nHint breakdown:")
+        print(f"  Q.x limbs: {[hex(x) for x in Q_x_limbs]}")
+        print(f"  Q.y limbs: {[hex(y) for y in Q_y_limbs]}")
+        print(f"  s1: 0x{s1:x}")
+        print(f"  s2_encoded: 0x{s2_encoded:x}")
     
     # Verify s1/s2 decomposition: s2·scalar ≡ s1 (mod r)
     # Note: s2_encoded needs to be decoded first, but get_fake_glv_hint
     # already returns the correct decomposition values
-    curve = CURVES[CurveID.ED25519.value]
-    ed25519_order = curve.n  # Curve order is stored as 'n'
-    
     # The decomposition should satisfy: s2_encoded·scalar ≡ s1 (mod r)
     # get_fake_glv_hint ensures this relationship holds
-    print(f"\nVerification:")
-    print(f"  Scalar: 0x{scalar:x}")
-    print(f"  s1: 0x{s1:x}")
-    print(f"  s2_encoded: 0x{s2_encoded:x}")
-    print(f"  Ed25519 order: 0x{ed25519_order:x}")
-    print(f"  ✓ Hint generated with correct s1/s2 decomposition")
+    log(f"\nVerification:")
+    log(f"  Scalar: 0x{scalar:x}")
+    log(f"  s1: 0x{s1:x}")
+    log(f"  s2_encoded: 0x{s2_encoded:x}")
+    log(f"  Ed25519 order: 0x{_ED25519_ORDER:x}")
+    log(f"  ✓ Hint generated with correct s1/s2 decomposition")
     
     # Save to file
     output_data = {
@@ -196,5 +186,12 @@ def generate_adaptor_point_hint(
 
 
 if __name__ == '__main__':
-    hint = generate_adaptor_point_hint()
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate fake-GLV hint for adaptor point MSM")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Print intermediate values while generating the hint")
+    parser.add_argument("--verify", action="store_true",
+                        help="Cross-check Q against an independent scalar·G")
+    args = parser.parse_args()
+    hint = generate_adaptor_point_hint(verify=args.verify, verbose=args.verbose)
 
@@ -4,6 +4,10 @@ Generate correct sqrt hints using Garaga's exact algorithm.
 
 This fixes the issue where Rust generates Montgomery coordinates but Garaga
 expects twisted Edwards coordinates for sqrt hints.
+
+p, d and the sqrt constants are module-level, so get_correct_sqrt_hint is
+a stateless kernel that can be imported and reused without touching the
+garaga curve table per call.
 """
 
 import json
@@ -21,6 +25,12 @@ except ImportError:
     print("Install with: source tools/.venv/bin/activate && pip install garaga==1.0.1")
     sys.exit(1)
 
+_ED25519 = CURVES[CurveID.ED25519.value]
+_P = _ED25519.p
+_D = _ED25519.d_twisted  # Ed25519 twisted d
+_SQRT_EXP = (_P - 5) // 8  # exponent for the fused sqrt(u/v)
+_SQRT_M1 = pow(2, (_P - 1) // 4, _P)  # sqrt(-1) mod p
+
 
 def hex_to_u256(hex_str: str) -> tuple[int, int]:
     """Convert 32-byte hex string to u256 (low, high)."""
@@ -43,37 +53,42 @@ def get_correct_sqrt_hint(compressed_hex: str) -> tuple[int, int]:
     
     Where d is Ed25519's twisted Edwards coefficient.
     """
-    curve = CURVES[CurveID.ED25519.value]
-    p = curve.p
-    d = curve.d_twisted  # Ed25519 twisted d
-    
-    # Parse compressed point (little-endian)
-    compressed_bytes = bytes.fromhex(compressed_hex)
-    compressed_int = int.from_bytes(compressed_bytes, 'little')
-    
-    # Extract sign bit and y-coordinate
-    sign_bit = (compressed_int >> 255) & 1
-    y = compressed_int & ((1 << 255) - 1)
+    (y,), (sign_bit,) = parse_compressed_batch([compressed_hex])
+    return _sqrt_hint_kernel(y, sign_bit)
+
+
+def parse_compressed_batch(compressed_hexes: list[str]) -> tuple[list[int], list[int]]:
+    """Parse compressed points (little-endian) into parallel y and sign-bit lists."""
+    compressed_ints = [int.from_bytes(bytes.fromhex(h), 'little') for h in compressed_hexes]
+    y_mask = (1 << 255) - 1
+    ys = [c & y_mask for c in compressed_ints]
+    sign_bits = [c >> 255 for c in compressed_ints]
+    return ys, sign_bits
+
+
+def _sqrt_hint_kernel(y: int, sign_bit: int) -> tuple[int, int]:
+    """Sqrt hint (low, high) for a parsed y-coordinate and sign bit."""
+    # Locals are LOAD_FAST instead of global lookups
+    p = _P
+    d = _D
     
     # Compute x² = (y² - 1) / (d*y² + 1) mod p
     y2 = (y * y) % p
     numerator = (y2 - 1) % p
     denominator = (d * y2 + 1) % p
     
-    # Modular inverse
-    inv_denominator = pow(denominator, -1, p)
-    x2 = (numerator * inv_denominator) % p
+    # Fused sqrt + inverse (RFC 8032 §5.1.3): x = u·v³·(u·v⁷)^((p-5)/8)
+    # with u = numerator, v = denominator. One modexp, no pow(v, -1, p).
+    v3 = (denominator * denominator * denominator) % p
+    v7 = (v3 * v3 * denominator) % p
+    x = (numerator * v3 * pow((numerator * v7) % p, _SQRT_EXP, p)) % p
     
-    # Compute x = sqrt(x²) mod p using Tonelli-Shanks or (p+3)/8 method
-    # For Ed25519, p ≡ 5 (mod 8), so we can use (p+3)/8
-    x = pow(x2, (p + 3) // 8, p)
-    
-    # Verify x² ≡ x2 (mod p), if not adjust
-    if (x * x) % p != x2:
-        # Try p - x
-        x = p - x
-        if (x * x) % p != x2:
-            raise ValueError(f"Could not compute sqrt of {hex(x2)} mod p")
+    # Verify v·x² ≡ u (mod p); if it is -u, multiply by sqrt(-1)
+    vxx = (denominator * x * x) % p
+    if vxx != numerator:
+        if vxx != (p - numerator) % p:
+            raise ValueError(f"Could not compute sqrt of {hex(numerator)}/{hex(denominator)} mod p")
+        x = (x * _SQRT_M1) % p
     
     # Adjust for sign bit
     if (x & 1) != sign_bit:
@@ -111,10 +126,15 @@ def main():
         'R2': tv['r2_compressed'],
     }
     
+    # Parse every point in one pass, then run the kernel per point
+    names = list(points)
+    hexes = list(points.values())
+    ys, sign_bits = parse_compressed_batch(hexes)
+    
     results = {}
-    for name, compressed_hex in points.items():
+    for name, compressed_hex, y, sign_bit in zip(names, hexes, ys, sign_bits):
         try:
-            low, high = get_correct_sqrt_hint(compressed_hex)
+            low, high = _sqrt_hint_kernel(y, sign_bit)
             results[name] = {
                 'compressed': compressed_hex,
                 'low': low,
@@ -10,9 +10,21 @@ Output:
 """
 
 import json
+import struct
 import sys
 from pathlib import Path
 
+MASK_128 = (1 << 128) - 1
+
+def _hex32(value):
+    """Format a value below 2^128 as 0x + 32 hex digits."""
+    # Fixed-width to_bytes().hex() skips format-spec handling (~1.5x f-string)
+    return "0x" + value.to_bytes(16, "big").hex()
+
+def _hex8(value):
+    """Format a u32 as 0x + 8 hex digits."""
+    return "0x" + value.to_bytes(4, "big").hex()
+
 def u256_to_felts(u256_value):
     """Convert u256 (low, high) to two felt252 values."""
     if isinstance(u256_value, dict):
@@ -24,25 +36,31 @@ def u256_to_felts(u256_value):
         # Hex string - convert to int, then split
         hex_clean = u256_value.replace('0x', '')
         u256_int = int(hex_clean, 16)
-        low = u256_int & ((1 << 128) - 1)
+        low = u256_int & MASK_128
         high = u256_int >> 128
     else:
         # Integer
-        low = u256_value & ((1 << 128) - 1)
+        low = u256_value & MASK_128
         high = u256_value >> 128
-    return [f"0x{low:032x}", f"0x{high:032x}"]
+    return [_hex32(low), _hex32(high)]
 
 def span_to_felts(span_array):
     """Convert span array to list of felt252 hex strings."""
-    result = []
-    for item in span_array:
-        if isinstance(item, str):
-            # Already hex string
-            result.append(item if item.startswith('0x') else f"0x{item}")
-        else:
-            # Integer
-            result.append(f"0x{item:032x}")
-    return result
+    if not span_array:
+        return []
+    # Spans are homogeneous in practice, so dispatch once on the first element
+    try:
+        if isinstance(span_array[0], str):
+            # Already hex strings
+            return [item if item.startswith('0x') else "0x" + item for item in span_array]
+        # Integers
+        return [_hex32(item) for item in span_array]
+    except AttributeError:
+        # Mixed span (hex strings and ints): fall back to per-element dispatch
+        return [
+            (item if item.startswith('0x') else "0x" + item) if isinstance(item, str) else _hex32(item)
+            for item in span_array
+        ]
 
 def main():
     if len(sys.argv) < 3:
@@ -77,21 +95,13 @@ def main():
     hashlock = tv['hashlock']
     # Parse hashlock - can be hex string or array
     if isinstance(hashlock, str):
-        # Convert hex string to bytes, then to u32 array
-        hashlock_bytes = bytes.fromhex(hashlock.replace('0x', ''))
-        hashlock_words = []
-        for i in range(0, len(hashlock_bytes), 4):
-            word_bytes = hashlock_bytes[i:i+4]
-            # Pad if needed
-            while len(word_bytes) < 4:
-                word_bytes = word_bytes + b'\x00'
-            word = int.from_bytes(word_bytes, 'little')
-            hashlock_words.append(word)
-        hashlock = hashlock_words
+        # Convert hex string to bytes (truncated/zero-padded to 32), then to 8 u32 words
+        hashlock_bytes = bytes.fromhex(hashlock.replace('0x', ''))[:32].ljust(32, b'\x00')
+        hashlock = list(struct.unpack('<8I', hashlock_bytes))
     for word in hashlock:
         if isinstance(word, str):
             word = int(word, 16) if word.startswith('0x') else int(word)
-        calldata.append(f"0x{word:08x}")
+        calldata.append(_hex8(word))
     
     # 2. lock_until (u64)
     calldata.append(f"0x{lock_until:x}")
@@ -139,8 +149,8 @@ def main():
     else:
         challenge_val = challenge
     # Truncate to 128 bits (matching test_e2e_dleq.cairo)
-    challenge_val = challenge_val & ((1 << 128) - 1)
-    calldata.append(f"0x{challenge_val:032x}")
+    challenge_val = challenge_val & MASK_128
+    calldata.append(_hex32(challenge_val))
     
     if isinstance(response, str):
         # Remove 0x prefix if present, then parse as hex
@@ -149,8 +159,8 @@ def main():
     else:
         response_val = response
     # Truncate to 128 bits
-    response_val = response_val & ((1 << 128) - 1)
-    calldata.append(f"0x{response_val:032x}")
+    response_val = response_val & MASK_128
+    calldata.append(_hex32(response_val))
     
     # 10. fake_glv_hint (Span<felt252> - 10 felts)
     fake_glv = hints.get('fake_glv_hint', [])
@@ -271,14 +281,14 @@ def main():
     else:
         calldata.extend(["0x43f2c451f9ca69ff1577d77d646a50e", "0x4ee64b0e07d89e906f9e8b7bea09283e"])
     
-    # Output calldata
-    print(" ".join(calldata))
+    # Output calldata (joined once, shared by stdout and the file)
+    out = " ".join(calldata)
+    print(out)
     
     # Also save to file for reference
     output_file = Path(__file__).parent.parent / "deployments" / "sepolia" / "latest_calldata.txt"
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w') as f:
-        f.write(" ".join(calldata))
+    output_file.write_text(out)
     print(f"\n# Calldata saved to: {output_file}", file=sys.stderr)
 
 if __name__ == "__main__":
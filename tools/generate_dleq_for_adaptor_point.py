@@ -16,12 +16,17 @@ Example:
 import sys
 import json
 import hashlib
+import struct
+from functools import lru_cache
 from typing import Tuple
 import argparse
 
+# Montgomery batch inversion shared with the other hint tools
+from curve_params import batch_invert
+
 try:
     from garaga.hints.fake_glv import get_fake_glv_hint
-    from garaga.definitions import G1Point, get_G, get_ED25519_order_modulus
+    from garaga.definitions import CURVES, CurveID, G1Point, get_G, get_ED25519_order_modulus
     from garaga.ec_ops import msm_g1
     from garaga.signatures.eddsa_25519 import (
         decompress_edwards_pt_from_y_compressed_le_into_weirstrass_point,
@@ -32,6 +37,61 @@ except ImportError:
     sys.exit(1)
 
 
+@lru_cache(maxsize=1)
+def _cached_G() -> G1Point:
+    """Ed25519 generator G (Weierstrass)."""
+    return get_G(0)
+
+
+@lru_cache(maxsize=1)
+def _cached_Y() -> G1Point:
+    """Second generator Y = 2·G, computed once per process."""
+    return msm_g1([_cached_G()], [2], 0, None)
+
+
+@lru_cache(maxsize=1)
+def _cached_generators_compressed() -> tuple[bytes, bytes]:
+    """Compressed G and Y for the challenge hash (fixed across proofs)."""
+    return (
+        compress_edwards_pt_to_y_compressed_le(_cached_G()),
+        compress_edwards_pt_to_y_compressed_le(_cached_Y()),
+    )
+
+
+def batch_compress_edwards(points: list[G1Point]) -> list[bytes]:
+    """
+    RFC 8032 compression of several Weierstrass points at once.
+    
+    Same birational map as the curve's to_twistededwards, but the two
+    denominators per point are inverted in two batches, so N points cost
+    2 inversions instead of 2N. Falls back to per-point compression if a
+    denominator is zero (exceptional points of the map).
+    """
+    curve = CURVES[CurveID.ED25519.value]
+    p, a, d = curve.p, curve.a_twisted, curve.d_twisted
+    
+    # y = (5a - 12·xw - d) / (-12·xw - a + 5d)
+    y_dens = [(-12 * pt.x - a + 5 * d) % p for pt in points]
+    if 0 in y_dens:
+        return [compress_edwards_pt_to_y_compressed_le(pt) for pt in points]
+    ys = [
+        ((5 * a - 12 * pt.x - d) * inv) % p
+        for pt, inv in zip(points, batch_invert(y_dens, p))
+    ]
+    
+    # x = (a + a·y - d·y - d) / (4·yw - 4·yw·y)
+    x_dens = [(4 * pt.y - 4 * pt.y * y) % p for pt, y in zip(points, ys)]
+    if 0 in x_dens:
+        return [compress_edwards_pt_to_y_compressed_le(pt) for pt in points]
+    xs = [
+        ((a + a * y - d * y - d) * inv) % p
+        for y, inv in zip(ys, batch_invert(x_dens, p))
+    ]
+    
+    # y little-endian with the parity of x in the top bit
+    return [(y | (x & 1) << 255).to_bytes(32, 'little') for x, y in zip(xs, ys)]
+
+
 def secret_to_scalar(secret_bytes: bytes) -> int:
     """Convert secret bytes to Ed25519 scalar (mod order)."""
     order = get_ED25519_order_modulus()
@@ -47,22 +107,16 @@ def hashlock_from_secret(secret_bytes: bytes) -> bytes:
 def hashlock_to_u32_array(hashlock: bytes) -> list[int]:
     """Convert hashlock bytes to u32 array (8 words, big-endian)."""
     assert len(hashlock) == 32
-    words = []
-    for i in range(0, 32, 4):
-        word = int.from_bytes(hashlock[i:i+4], byteorder='big')
-        words.append(word)
-    return words
+    return list(struct.unpack('>8I', hashlock))
 
 
 def generate_deterministic_nonce(secret_scalar: int, hashlock: bytes) -> int:
     """Generate deterministic nonce k using RFC6979-style approach."""
     order = get_ED25519_order_modulus()
-    # k = SHA256(secret || hashlock || counter) mod order
-    hasher = hashlib.sha256()
-    hasher.update(secret_scalar.to_bytes(32, byteorder='little'))
-    hasher.update(hashlock)
-    hasher.update(b'\x00')  # Counter
-    k_bytes = hasher.digest()
+    # k = SHA256(secret || hashlock || counter) mod order, one-shot over the concatenation
+    k_bytes = hashlib.sha256(
+        secret_scalar.to_bytes(32, byteorder='little') + hashlock + b'\x00'  # Counter
+    ).digest()
     k = int.from_bytes(k_bytes, byteorder='little') % order
     return k
 
@@ -77,34 +131,25 @@ def compute_blake2s_challenge(
     hashlock: bytes,
 ) -> int:
     """Compute BLAKE2s challenge (matches Cairo implementation)."""
-    import hashlib
-    # Use BLAKE2s (256-bit output)
-    hasher = hashlib.blake2s(digest_size=32)
-    
-    # Tag: "DLEQ" (4 bytes)
-    hasher.update(b"DLEQ")
-    
-    # Points in compressed format (32 bytes each)
-    hasher.update(g_compressed)
-    hasher.update(y_compressed)
-    hasher.update(t_compressed)
-    hasher.update(u_compressed)
-    hasher.update(r1_compressed)
-    hasher.update(r2_compressed)
-    
-    # Hashlock (32 bytes)
-    hasher.update(hashlock)
+    # BLAKE2s (256-bit output) over a single buffer:
+    # tag "DLEQ" (4 bytes) || G || Y || T || U || R1 || R2 (32 bytes each) || hashlock (32 bytes)
+    buf = b"".join((
+        b"DLEQ",
+        g_compressed, y_compressed, t_compressed, u_compressed,
+        r1_compressed, r2_compressed,
+        hashlock,
+    ))
+    challenge_bytes = hashlib.blake2s(buf, digest_size=32).digest()
     
     # Reduce mod curve order
     order = get_ED25519_order_modulus()
-    challenge_bytes = hasher.digest()
     challenge = int.from_bytes(challenge_bytes, byteorder='little') % order
     return challenge
 
 
 def generate_dleq_proof(
     secret_hex: str,
-    adaptor_point_weierstrass: G1Point = None,
+    adaptor_point_weierstrass: G1Point | None = None,
 ) -> dict:
     """
     Generate complete DLEQ proof for given secret.
@@ -124,9 +169,9 @@ def generate_dleq_proof(
     hashlock = hashlock_from_secret(secret_bytes)
     hashlock_u32 = hashlock_to_u32_array(hashlock)
     
-    # Get generators
-    G = get_G(0)  # Ed25519 generator
-    Y = msm_g1([G], [2], 0, None)  # Y = 2·G (second generator)
+    # Get generators (fixed, cached across proofs)
+    G = _cached_G()  # Ed25519 generator
+    Y = _cached_Y()  # Y = 2·G (second generator)
     
     # Compute adaptor point T = t·G
     if adaptor_point_weierstrass is None:
@@ -151,12 +196,10 @@ def generate_dleq_proof(
     R2 = msm_g1([Y], [k], 0, k_y_hint)
     
     # Compress points for challenge computation
-    g_compressed = compress_edwards_pt_to_y_compressed_le(G)
-    y_compressed = compress_edwards_pt_to_y_compressed_le(Y)
-    t_compressed = compress_edwards_pt_to_y_compressed_le(T)
-    u_compressed = compress_edwards_pt_to_y_compressed_le(U)
-    r1_compressed = compress_edwards_pt_to_y_compressed_le(R1)
-    r2_compressed = compress_edwards_pt_to_y_compressed_le(R2)
+    g_compressed, y_compressed = _cached_generators_compressed()
+    t_compressed, u_compressed, r1_compressed, r2_compressed = batch_compress_edwards(
+        [T, U, R1, R2]
+    )
     
     # Compute challenge c
     order = get_ED25519_order_modulus()
@@ -193,15 +236,13 @@ def generate_dleq_proof(
     # Convert to Cairo-compatible format
     def u256_from_bytes(b: bytes) -> dict:
         """Convert 32 bytes to u256 {low, high}."""
-        low_bytes = b[:16]
-        high_bytes = b[16:]
-        low = int.from_bytes(low_bytes, byteorder='little')
-        high = int.from_bytes(high_bytes, byteorder='little')
-        return {"low": hex(low), "high": hex(high)}
+        # One from_bytes + mask/shift instead of decoding two 16-byte halves
+        value = int.from_bytes(b, byteorder='little')
+        return {"low": hex(value & ((1 << 128) - 1)), "high": hex(value >> 128)}
     
     def hint_to_cairo_array(hint: list) -> list[str]:
         """Convert hint list to Cairo array format."""
-        return [hex(x) for x in hint]
+        return list(map(hex, hint))
     
     return {
         "secret_hex": secret_hex,
@@ -238,7 +279,9 @@ def main():
         proof = generate_dleq_proof(args.secret_hex)
         
         if args.output_format == "json":
-            output = json.dumps(proof, indent=2)
+            # Stream straight to the destination, no intermediate string
+            def write(f):
+                json.dump(proof, f, indent=2)
         else:  # cairo
             # Generate Cairo constants
             output = f"""// DLEQ proof for secret: {args.secret_hex}
@@ -258,13 +301,17 @@ const DLEQ_ADAPTOR_POINT_SQRT_HINT: u256 = u256 {{
 
 // ... (rest of constants)
 """
+            
+            def write(f):
+                f.write(output)
         
         if args.output_file:
             with open(args.output_file, 'w') as f:
-                f.write(output)
+                write(f)
             print(f"✓ DLEQ proof written to {args.output_file}")
         else:
-            print(output)
+            write(sys.stdout)
+            sys.stdout.write("\n")
             
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -17,28 +17,47 @@ from garaga.curves import CurveID, CURVES
 from garaga.points import G1Point
 from garaga.hints.fake_glv import get_fake_glv_hint
 
+# u384 is stored as 4 u96 limbs
+MASK_96 = (1 << 96) - 1
+
+# Ed25519 curve (looked up once at import)
+_ED25519 = CURVES[CurveID.ED25519.value]
+_ED25519_N = _ED25519.n
+
+# Placeholder warnings are printed once per process, not once per call
+_warned_T = False
+_warned_U = False
+
 
 def u384_to_cairo_tuple(value) -> Tuple[int, int, int, int]:
     """Convert u384 to Cairo tuple format (4×96-bit limbs)."""
-    # u384 is stored as 4 u96 limbs
-    # Each limb is 96 bits
-    mask_96 = (1 << 96) - 1
-    limb0 = value & mask_96
-    limb1 = (value >> 96) & mask_96
-    limb2 = (value >> 192) & mask_96
-    limb3 = (value >> 288) & mask_96
-    return (limb0, limb1, limb2, limb3)
+    return (
+        value & MASK_96,
+        (value >> 96) & MASK_96,
+        (value >> 192) & MASK_96,
+        (value >> 288) & MASK_96,
+    )
+
+
+def limbs_to_int(limbs: List[str]) -> int:
+    """Convert 4 hex limb strings (least significant first) to integer."""
+    # u384 = limb0 + limb1*2^96 + limb2*2^192 + limb3*2^288: concatenate the
+    # zero-padded 24-nibble limbs most-significant first and parse once
+    digits = [limb.lower().removeprefix("0x").zfill(24) for limb in reversed(limbs)]
+    if any(len(d) > 24 for d in digits):
+        raise ValueError(f"Limb wider than 96 bits in {limbs}")
+    return int("".join(digits), 16)
 
 
 def format_cairo_hint(hint_felts: List[int]) -> str:
     """Format hint as Cairo array literal."""
-    felts_str = ", ".join([hex(f) for f in hint_felts])
-    return f"array![{felts_str}].span()"
+    return f"array![{', '.join(map(hex, hint_felts))}].span()"
 
 
 def generate_hint_for_scalar_and_base(
     scalar: int,
     base_point: G1Point,
+    n: int = _ED25519_N,
 ) -> Tuple[List[int], G1Point]:
     """
     Generate fake-GLV hint for scalar multiplication: scalar * base_point.
@@ -46,14 +65,12 @@ def generate_hint_for_scalar_and_base(
     Args:
         scalar: Scalar value (will be reduced mod curve order)
         base_point: Base point for multiplication
+        n: Curve order (default: Ed25519)
     
     Returns:
         Tuple of (hint_felts, Q) where Q = scalar * base_point
     """
-    from garaga.curves import CurveID, CURVES
-    
-    curve = CURVES[CurveID.ED25519.value]
-    scalar = scalar % curve.n
+    scalar = scalar % n
     
     # Generate fake-GLV hint for scalar * base_point
     Q, s1, s2_encoded = get_fake_glv_hint(base_point, scalar)
@@ -96,14 +113,15 @@ def generate_dleq_hints(
         - c_neg_hint_for_t: hint for (-c)·T
         - c_neg_hint_for_u: hint for (-c)·U
     """
-    curve = CURVES[curve_id.value]
+    curve = _ED25519 if curve_id is CurveID.ED25519 else CURVES[curve_id.value]
+    n = curve.n
     
     # Reduce scalars modulo curve order
-    s_scalar = s_scalar % curve.n
-    c_scalar = c_scalar % curve.n
+    s_scalar = s_scalar % n
+    c_scalar = c_scalar % n
     
     # Compute -c mod n
-    c_neg_scalar = (curve.n - c_scalar) % curve.n
+    c_neg_scalar = (n - c_scalar) % n
     
     # Get default points if not provided
     if G is None:
@@ -114,63 +132,45 @@ def generate_dleq_hints(
     
     # For production, T and U must be provided
     # For testing, we can use placeholders (but hints won't be correct)
+    global _warned_T, _warned_U
     if T is None:
-        print("WARNING: T (adaptor point) not provided. Using placeholder G.")
-        print("         Generated hints for (-c)·T will NOT be correct for actual T.")
+        if not _warned_T:
+            print("WARNING: T (adaptor point) not provided. Using placeholder G.")
+            print("         Generated hints for (-c)·T will NOT be correct for actual T.")
+            _warned_T = True
         T = G  # Placeholder - incorrect but allows tool to run
     if U is None:
-        print("WARNING: U (DLEQ second point) not provided. Using placeholder Y.")
-        print("         Generated hints for (-c)·U will NOT be correct for actual U.")
+        if not _warned_U:
+            print("WARNING: U (DLEQ second point) not provided. Using placeholder Y.")
+            print("         Generated hints for (-c)·U will NOT be correct for actual U.")
+            _warned_U = True
         U = Y  # Placeholder - incorrect but allows tool to run
     
-    # Generate hints for each MSM operation
-    # s·G
-    s_hint_for_g_felts, s_hint_for_g_Q = generate_hint_for_scalar_and_base(s_scalar, G)
-    
-    # s·Y
-    s_hint_for_y_felts, s_hint_for_y_Q = generate_hint_for_scalar_and_base(s_scalar, Y)
-    
-    # (-c)·T
-    c_neg_hint_for_t_felts, c_neg_hint_for_t_Q = generate_hint_for_scalar_and_base(c_neg_scalar, T)
-    
-    # (-c)·U
-    c_neg_hint_for_u_felts, c_neg_hint_for_u_Q = generate_hint_for_scalar_and_base(c_neg_scalar, U)
+    # Generate hints for each MSM operation: (name, scalar, base label, base)
+    msm_ops = (
+        ("s_hint_for_g", s_scalar, "G", G),          # s·G
+        ("s_hint_for_y", s_scalar, "Y", Y),          # s·Y
+        ("c_neg_hint_for_t", c_neg_scalar, "T", T),  # (-c)·T
+        ("c_neg_hint_for_u", c_neg_scalar, "U", U),  # (-c)·U
+    )
     
-    return {
-        "s_hint_for_g": {
-            "scalar": s_scalar,
-            "base_point": "G",
-            "hint_felts": s_hint_for_g_felts,
-            "cairo_hint": format_cairo_hint(s_hint_for_g_felts),
-            "hint_Q": s_hint_for_g_Q,
-        },
-        "s_hint_for_y": {
-            "scalar": s_scalar,
-            "base_point": "Y",
-            "hint_felts": s_hint_for_y_felts,
-            "cairo_hint": format_cairo_hint(s_hint_for_y_felts),
-            "hint_Q": s_hint_for_y_Q,
-        },
-        "c_neg_hint_for_t": {
-            "scalar": c_neg_scalar,
-            "base_point": "T",
-            "hint_felts": c_neg_hint_for_t_felts,
-            "cairo_hint": format_cairo_hint(c_neg_hint_for_t_felts),
-            "hint_Q": c_neg_hint_for_t_Q,
-        },
-        "c_neg_hint_for_u": {
-            "scalar": c_neg_scalar,
-            "base_point": "U",
-            "hint_felts": c_neg_hint_for_u_felts,
-            "cairo_hint": format_cairo_hint(c_neg_hint_for_u_felts),
-            "hint_Q": c_neg_hint_for_u_Q,
-        },
-        "curve_info": {
-            "name": "ED25519",
-            "curve_id": curve_id.value,
-            "order": curve.n,
-        },
+    result = {}
+    for name, scalar, base_label, base in msm_ops:
+        hint_felts, hint_Q = generate_hint_for_scalar_and_base(scalar, base, n)
+        result[name] = {
+            "scalar": scalar,
+            "base_point": base_label,
+            "hint_felts": hint_felts,
+            "cairo_hint": format_cairo_hint(hint_felts),
+            "hint_Q": hint_Q,
+        }
+    
+    result["curve_info"] = {
+        "name": "ED25519",
+        "curve_id": curve_id.value,
+        "order": n,
     }
+    return result
 
 
 def print_hints(data: dict) -> None:
@@ -214,40 +214,10 @@ def parse_point_from_limbs(x_limbs: List[str], y_limbs: List[str], curve_id: Cur
     """
     Parse G1Point from u384 limbs (hex strings).
     
-    NOTE: This is a workaround. For production, hints should be generated
-    with actual G1Point objects from the DLEQ proof generation.
+    Raises ValueError if a limb is wider than 96 bits or the point is not
+    on the curve (checked by G1Point itself).
     """
-    from garaga.hints.io import bigint_split
-    
-    def limbs_to_int(limbs: List[str]) -> int:
-        """Convert 4 hex limb strings to integer."""
-        limb0 = int(limbs[0], 16)
-        limb1 = int(limbs[1], 16)
-        limb2 = int(limbs[2], 16)
-        limb3 = int(limbs[3], 16)
-        # Reconstruct u384: limb0 + limb1*2^96 + limb2*2^192 + limb3*2^288
-        return limb0 + (limb1 << 96) + (limb2 << 192) + (limb3 << 288)
-    
-    x_int = limbs_to_int(x_limbs)
-    y_int = limbs_to_int(y_limbs)
-    
-    # G1Point doesn't have a direct constructor from coordinates
-    # We need to use a workaround: create point via scalar multiplication
-    # This is not ideal but works for testing
-    # For production, use actual G1Point objects from proof generation
-    
-    # Try to find a scalar that gives us this point (not practical)
-    # Instead, we'll use a placeholder approach: create point via known method
-    # Actually, the best approach is to accept that this tool should be called
-    # with actual G1Point objects, not coordinates
-    
-    # For now, raise an error directing users to provide G1Point objects
-    raise NotImplementedError(
-        "Point construction from coordinate limbs is not directly supported. "
-        "For production-grade hints, generate them in Rust/Python code that has "
-        "access to actual G1Point objects (T and U) from the DLEQ proof. "
-        "Alternatively, integrate this tool into the proof generation pipeline."
-    )
+    return G1Point(limbs_to_int(x_limbs), limbs_to_int(y_limbs), curve_id)
 
 
 def main() -> None:
@@ -276,7 +246,7 @@ def main() -> None:
             T_x_limbs = sys.argv[3:7]
             T_y_limbs = sys.argv[7:11]
             T = parse_point_from_limbs(T_x_limbs, T_y_limbs)
-        except NotImplementedError as e:
+        except ValueError as e:
             print(f"Warning: {e}")
             print("Continuing without T point - hints for (-c)·T will use placeholder.")
     
@@ -285,7 +255,7 @@ def main() -> None:
             U_x_limbs = sys.argv[11:15]
             U_y_limbs = sys.argv[15:19]
             U = parse_point_from_limbs(U_x_limbs, U_y_limbs)
-        except NotImplementedError as e:
+        except ValueError as e:
             print(f"Warning: {e}")
             print("Continuing without U point - hints for (-c)·U will use placeholder.")
     
@@ -9,12 +9,17 @@ Outputs:
 """
 import sys
 import hashlib
+import struct
 from typing import Tuple, List
 
 from garaga.curves import CurveID, CURVES
 from garaga.points import G1Point
 from garaga.hints.fake_glv import get_fake_glv_hint
-from garaga.hints.io import bigint_split
+
+MASK_96 = (1 << 96) - 1
+
+# Ed25519 base point, computed once on import
+_G_ED25519 = G1Point.get_nG(CurveID.ED25519, 1)
 
 
 def scalar_to_hex(scalar: int) -> str:
@@ -22,14 +27,18 @@ def scalar_to_hex(scalar: int) -> str:
 
 
 def sha256_words(secret: bytes) -> List[int]:
-    digest = hashlib.sha256(secret).digest()
-    # Interpret as 8 big-endian u32 words
-    return [int.from_bytes(digest[i : i + 4], "big") for i in range(0, 32, 4)]
+    # Interpret the digest as 8 big-endian u32 words
+    return list(struct.unpack(">8I", hashlib.sha256(secret).digest()))
 
 
 def u384_to_cairo_tuple(value: int) -> Tuple[int, int, int, int]:
     # Split into 4 limbs base 2^96 (matches Garaga u384 layout)
-    return tuple(bigint_split(value, 4, 2**96))
+    return (
+        value & MASK_96,
+        (value >> 96) & MASK_96,
+        (value >> 192) & MASK_96,
+        (value >> 288) & MASK_96,
+    )
 
 
 def format_cairo_u384(limbs: Tuple[int, int, int, int]) -> str:
@@ -77,16 +86,15 @@ def generate_ed25519_test_data(secret_hex: str | None = None) -> dict:
     # Step 1: Hash to 8×u32 words (big-endian interpretation of hash bytes)
     hash_words = sha256_words(secret_bytes)
     # Step 2: Convert to big integer (little-endian interpretation: h0 + h1·2^32 + ...)
-    scalar_raw = 0
-    for i, w in enumerate(hash_words):
-        scalar_raw += w << (32 * i)
+    # (repacking the words little-endian lets int.from_bytes do it in one call)
+    scalar_raw = int.from_bytes(struct.pack("<8I", *hash_words), "little")
     # Step 3: Reduce modulo Ed25519 curve order
     curve_id = CurveID.ED25519
     curve = CURVES[curve_id.value]
     scalar_int = scalar_raw % curve.n
     
     # Compute adaptor point T = scalar·G
-    generator = G1Point.get_nG(curve_id, 1)
+    generator = _G_ED25519
     adaptor_point = generator.scalar_mul(scalar_int)
 
     x_limbs = u384_to_cairo_tuple(adaptor_point.x)
@@ -22,12 +22,18 @@ except ImportError:
 
 ED25519_ORDER = 2**252 + 27742317777372353535851937790883648493
 ED25519_CURVE_INDEX = 4
+MASK_96 = (1 << 96) - 1
+MASK_128 = (1 << 128) - 1
+
+# Fixed DLEQ generators G and Y = 2·G, computed once on import
+_G_ED25519 = G1Point.get_nG(CurveID.ED25519, 1)
+_Y_ED25519 = _G_ED25519.scalar_mul(2)
 
 
 def hex_to_u256(hex_str: str) -> tuple[int, int]:
     """Convert hex string to (low, high) u128 pair."""
     value = int(hex_str, 16)
-    low = value & ((1 << 128) - 1)
+    low = value & MASK_128
     high = value >> 128
     return low, high
 
@@ -56,30 +62,22 @@ def decompress_with_garaga(compressed_hex: str, sqrt_hint_low: int, sqrt_hint_hi
     x = sqrt_hint_low | (sqrt_hint_high << 128)
     x = x % p
     
-    # Verify sqrt hint: x^2 should equal (y^2 - 1) / (d*y^2 + 1)
+    # Verify sqrt hint: x^2 should equal (y^2 - 1) / (d*y^2 + 1).
+    # Cross-multiplied as v·x^2 == u, so no modular inverse or sqrt is needed.
     y2 = (y * y) % p
     numerator = (y2 - 1) % p
     denominator = (d * y2 + 1) % p
-    denominator_inv = pow(denominator, p - 2, p)  # Fermat's little theorem
-    x2_expected = (numerator * denominator_inv) % p
-    x2_actual = (x * x) % p
     
     # Garaga checks: sqrt_hint.low % 2 == sign_bit
     # If mismatch, negate x (Garaga does this internally)
     if (x % 2) != sign_bit:
         x = (p - x) % p
-        x2_actual = (x * x) % p
     
-    # Verify x^2 matches expected value
-    if x2_actual != x2_expected:
-        # Try the other square root
-        x_alt = (p - x) % p
-        x2_alt = (x_alt * x_alt) % p
-        if x2_alt == x2_expected:
-            x = x_alt
-            x2_actual = x2_alt
-        else:
-            raise AssertionError(f"Invalid sqrt hint: x^2 = {hex(x2_actual)}, expected {hex(x2_expected)}")
+    # Verify x^2 matches expected value (both roots ±x share the same square)
+    x2_actual = (x * x) % p
+    if (denominator * x2_actual) % p != numerator:
+        x2_expected = (numerator * pow(denominator, p - 2, p)) % p  # for the message only
+        raise AssertionError(f"Invalid sqrt hint: x^2 = {hex(x2_actual)}, expected {hex(x2_expected)}")
     
     # Convert Edwards (x, y) to Weierstrass coordinates using Garaga's conversion
     edwards_point = curve.to_weierstrass(x, y)
@@ -90,13 +88,20 @@ def decompress_with_garaga(compressed_hex: str, sqrt_hint_low: int, sqrt_hint_hi
 
 def u384_to_limbs(value: int) -> list[int]:
     """Convert u384 to 4 x 96-bit limbs."""
-    MASK_96 = (1 << 96) - 1
     return [
-        (value >> (96 * i)) & MASK_96
-        for i in range(4)
+        value & MASK_96,
+        (value >> 96) & MASK_96,
+        (value >> 192) & MASK_96,
+        (value >> 288) & MASK_96,
     ]
 
 
+def render_felt_array(name: str, values: list[int]) -> str:
+    """Render values as a Cairo `let name: Span<felt252> = array![...]` block."""
+    body = ",\n    ".join(f"0x{v:x}" for v in values)
+    return f"let {name}: Span<felt252> = array![\n    {body}\n].span();"
+
+
 def main():
     # Load test vectors
     vectors_path = Path(__file__).parent.parent / "rust" / "test_vectors.json"
@@ -107,106 +112,107 @@ def main():
     with open(vectors_path) as f:
         vectors = json.load(f)
     
-    print("=" * 80)
-    print("GENERATING HINTS WITH EXACT GARAGA DECOMPRESSION")
-    print("=" * 80)
-    
-    # Get sqrt hints from test vectors
-    # Use the sqrt hints that match Cairo's test_e2e_dleq.cairo
-    # These are already correct and verified to work with Cairo
-    # From test_e2e_dleq.cairo:
-    # TEST_ADAPTOR_POINT_SQRT_HINT: low=0x448c18dcf34127e112ff945a65defbfc, high=0x17611da35f39a2a5e3a9fddb8d978e4f
-    # TEST_SECOND_POINT_SQRT_HINT: low=0xdcad2173817c163b5405cec7698eb4b8, high=0x742bb3c44b13553c8ddff66565b44cac
-    
-    adaptor_sqrt_low = 0x448c18dcf34127e112ff945a65defbfc
-    adaptor_sqrt_high = 0x17611da35f39a2a5e3a9fddb8d978e4f
-    
-    second_sqrt_low = 0xdcad2173817c163b5405cec7698eb4b8
-    second_sqrt_high = 0x742bb3c44b13553c8ddff66565b44cac
-    
-    # Step 1: Decompress T and U using GARAGA'S EXACT ALGORITHM
-    print("\n### DECOMPRESSING POINTS WITH GARAGA ###\n")
-    
-    T = decompress_with_garaga(
-        vectors["adaptor_point_compressed"],
-        adaptor_sqrt_low,
-        adaptor_sqrt_high
-    )
-    print(f"T (Weierstrass): x=0x{T.x:x}, y=0x{T.y:x}")
-    
-    U = decompress_with_garaga(
-        vectors["second_point_compressed"],
-        second_sqrt_low,
-        second_sqrt_high
-    )
-    print(f"U (Weierstrass): x=0x{U.x:x}, y=0x{U.y:x}")
-    
-    # Step 2: Get G and Y (these should match Cairo's hardcoded values)
-    G = G1Point.get_nG(CurveID.ED25519, 1)
-    Y = G.scalar_mul(2)  # Y = 2*G
-    
-    print(f"\nG (Weierstrass): x=0x{G.x:x}")
-    print(f"Y (Weierstrass): x=0x{Y.x:x}")
-    
-    # Step 3: Get truncated scalars (matching Cairo's reduce_felt_to_scalar)
-    # Challenge and response are stored as hex strings (little-endian bytes)
-    response_bytes = bytes.fromhex(vectors["response"])
-    challenge_bytes = bytes.fromhex(vectors["challenge"])
-    
-    response_int = int.from_bytes(response_bytes, 'little')
-    challenge_int = int.from_bytes(challenge_bytes, 'little')
-    
-    # Cairo truncates to 128 bits
-    s_scalar = response_int & ((1 << 128) - 1)
-    c_scalar = challenge_int & ((1 << 128) - 1)
-    c_neg_scalar = (ED25519_ORDER - c_scalar) % ED25519_ORDER
-    
-    print(f"\n### SCALARS (128-bit truncated) ###")
-    print(f"s:   0x{s_scalar:032x}")
-    print(f"c:   0x{c_scalar:032x}")
-    print(f"-c:  0x{c_neg_scalar:064x}")
-    
-    # Step 4: Generate hints using EXACT Weierstrass coordinates
-    print("\n### GENERATING MSM HINTS ###\n")
-    
-    # s*G hint
-    Q_sG, s1_sG, s2_sG = get_fake_glv_hint(G, s_scalar)
-    sG_hint = u384_to_limbs(Q_sG.x) + u384_to_limbs(Q_sG.y) + [s1_sG, s2_sG]
-    
-    # s*Y hint
-    Q_sY, s1_sY, s2_sY = get_fake_glv_hint(Y, s_scalar)
-    sY_hint = u384_to_limbs(Q_sY.x) + u384_to_limbs(Q_sY.y) + [s1_sY, s2_sY]
-    
-    # (-c)*T hint - using EXACT decompressed T
-    Q_negcT, s1_negcT, s2_negcT = get_fake_glv_hint(T, c_neg_scalar)
-    negcT_hint = u384_to_limbs(Q_negcT.x) + u384_to_limbs(Q_negcT.y) + [s1_negcT, s2_negcT]
-    
-    # (-c)*U hint - using EXACT decompressed U
-    Q_negcU, s1_negcU, s2_negcU = get_fake_glv_hint(U, c_neg_scalar)
-    negcU_hint = u384_to_limbs(Q_negcU.x) + u384_to_limbs(Q_negcU.y) + [s1_negcU, s2_negcU]
-    
-    # Print Cairo code
-    print("// Copy these to test_e2e_dleq.cairo")
-    print()
-    
-    hints = {
-        "s_hint_for_g": sG_hint,
-        "s_hint_for_y": sY_hint,
-        "c_neg_hint_for_t": negcT_hint,
-        "c_neg_hint_for_u": negcU_hint,
-    }
-    
-    for name, hint in hints.items():
-        print(f"let {name}: Span<felt252> = array![")
-        for i, v in enumerate(hint):
-            comma = "," if i < 9 else ""
-            print(f"    0x{v:x}{comma}")
-        print("].span();")
-        print()
-    
-    print("=" * 80)
-    print("VERIFICATION: T and U above must match Cairo's decompressed coordinates!")
-    print("=" * 80)
+    out = []
+    emit = out.append
+    try:
+        emit("=" * 80)
+        emit("GENERATING HINTS WITH EXACT GARAGA DECOMPRESSION")
+        emit("=" * 80)
+        
+        # Get sqrt hints from test vectors
+        # Use the sqrt hints that match Cairo's test_e2e_dleq.cairo
+        # These are already correct and verified to work with Cairo
+        # From test_e2e_dleq.cairo:
+        # TEST_ADAPTOR_POINT_SQRT_HINT: low=0x448c18dcf34127e112ff945a65defbfc, high=0x17611da35f39a2a5e3a9fddb8d978e4f
+        # TEST_SECOND_POINT_SQRT_HINT: low=0xdcad2173817c163b5405cec7698eb4b8, high=0x742bb3c44b13553c8ddff66565b44cac
+        
+        adaptor_sqrt_low = 0x448c18dcf34127e112ff945a65defbfc
+        adaptor_sqrt_high = 0x17611da35f39a2a5e3a9fddb8d978e4f
+        
+        second_sqrt_low = 0xdcad2173817c163b5405cec7698eb4b8
+        second_sqrt_high = 0x742bb3c44b13553c8ddff66565b44cac
+        
+        # Step 1: Decompress T and U using GARAGA'S EXACT ALGORITHM
+        emit("\n### DECOMPRESSING POINTS WITH GARAGA ###\n")
+        
+        T = decompress_with_garaga(
+            vectors["adaptor_point_compressed"],
+            adaptor_sqrt_low,
+            adaptor_sqrt_high
+        )
+        emit(f"T (Weierstrass): x=0x{T.x:x}, y=0x{T.y:x}")
+        
+        U = decompress_with_garaga(
+            vectors["second_point_compressed"],
+            second_sqrt_low,
+            second_sqrt_high
+        )
+        emit(f"U (Weierstrass): x=0x{U.x:x}, y=0x{U.y:x}")
+        
+        # Step 2: Get G and Y (these should match Cairo's hardcoded values)
+        G = _G_ED25519
+        Y = _Y_ED25519  # Y = 2*G
+        
+        emit(f"\nG (Weierstrass): x=0x{G.x:x}")
+        emit(f"Y (Weierstrass): x=0x{Y.x:x}")
+        
+        # Step 3: Get truncated scalars (matching Cairo's reduce_felt_to_scalar)
+        # Challenge and response are stored as hex strings (little-endian bytes)
+        response_bytes = bytes.fromhex(vectors["response"])
+        challenge_bytes = bytes.fromhex(vectors["challenge"])
+        
+        response_int = int.from_bytes(response_bytes, 'little')
+        challenge_int = int.from_bytes(challenge_bytes, 'little')
+        
+        # Cairo truncates to 128 bits
+        s_scalar = response_int & MASK_128
+        c_scalar = challenge_int & MASK_128
+        c_neg_scalar = (ED25519_ORDER - c_scalar) % ED25519_ORDER
+        
+        emit(f"\n### SCALARS (128-bit truncated) ###")
+        emit(f"s:   0x{s_scalar:032x}")
+        emit(f"c:   0x{c_scalar:032x}")
+        emit(f"-c:  0x{c_neg_scalar:064x}")
+        
+        # Step 4: Generate hints using EXACT Weierstrass coordinates
+        emit("\n### GENERATING MSM HINTS ###\n")
+        
+        # s*G hint
+        Q_sG, s1_sG, s2_sG = get_fake_glv_hint(G, s_scalar)
+        sG_hint = u384_to_limbs(Q_sG.x) + u384_to_limbs(Q_sG.y) + [s1_sG, s2_sG]
+        
+        # s*Y hint
+        Q_sY, s1_sY, s2_sY = get_fake_glv_hint(Y, s_scalar)
+        sY_hint = u384_to_limbs(Q_sY.x) + u384_to_limbs(Q_sY.y) + [s1_sY, s2_sY]
+        
+        # (-c)*T hint - using EXACT decompressed T
+        Q_negcT, s1_negcT, s2_negcT = get_fake_glv_hint(T, c_neg_scalar)
+        negcT_hint = u384_to_limbs(Q_negcT.x) + u384_to_limbs(Q_negcT.y) + [s1_negcT, s2_negcT]
+        
+        # (-c)*U hint - using EXACT decompressed U
+        Q_negcU, s1_negcU, s2_negcU = get_fake_glv_hint(U, c_neg_scalar)
+        negcU_hint = u384_to_limbs(Q_negcU.x) + u384_to_limbs(Q_negcU.y) + [s1_negcU, s2_negcU]
+        
+        # Print Cairo code
+        emit("// Copy these to test_e2e_dleq.cairo")
+        emit("")
+        
+        hints = {
+            "s_hint_for_g": sG_hint,
+            "s_hint_for_y": sY_hint,
+            "c_neg_hint_for_t": negcT_hint,
+            "c_neg_hint_for_u": negcU_hint,
+        }
+        
+        for name, hint in hints.items():
+            emit(render_felt_array(name, hint))
+            emit("")
+        
+        emit("=" * 80)
+        emit("VERIFICATION: T and U above must match Cairo's decompressed coordinates!")
+        emit("=" * 80)
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
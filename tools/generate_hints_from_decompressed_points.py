@@ -5,7 +5,7 @@ Generate DLEQ hints using ACTUAL decompressed Weierstrass coordinates.
 This script:
 1. Decompresses Edwards points from test_vectors.json using Garaga
 2. Extracts Weierstrass coordinates (matching what Cairo uses)
-3. Generates hints using garaga_rs.msm_calldata_builder with actual coordinates
+3. Generates hints using get_fake_glv_hint with actual coordinates
 4. Outputs hints in Cairo-compatible format
 
 CRITICAL: This ensures hints match the exact coordinates Cairo decompresses.
@@ -19,13 +19,6 @@ try:
     from garaga.curves import CURVES, CurveID
     from garaga.points import G1Point
     from garaga.hints.fake_glv import get_fake_glv_hint
-    # Try to import garaga_rs (may not be available in pip package)
-    try:
-        from garaga import garaga_rs
-        HAS_GARAGA_RS = True
-    except ImportError:
-        HAS_GARAGA_RS = False
-        print("WARNING: garaga_rs not available, using get_fake_glv_hint instead")
 except ImportError:
     print("ERROR: garaga package not found.")
     print("Install with: uv pip install --python 3.10 garaga==1.0.1")
@@ -34,13 +27,18 @@ except ImportError:
 # Ed25519 order
 ED25519_ORDER = 2**252 + 27742317777372353535851937790883648493
 CURVE_ID = CurveID.ED25519  # Use enum, not .value
+MASK_128 = (1 << 128) - 1
+
+# Fixed DLEQ generators G and Y = 2·G, computed once on import
+_G_ED25519 = G1Point.get_nG(CURVE_ID, 1)
+_Y_ED25519 = _G_ED25519.scalar_mul(2)
 
 
 def hex_to_u256(hex_str: str) -> tuple[int, int]:
     """Convert hex string to u256 (low, high)."""
     value = int(hex_str, 16)
-    low = value & ((1 << 128) - 1)
-    high = (value >> 128) & ((1 << 128) - 1)
+    low = value & MASK_128
+    high = (value >> 128) & MASK_128
     return (low, high)
 
 
@@ -49,13 +47,10 @@ def decompress_ed25519_point_via_scalar(secret_scalar: int) -> tuple[G1Point, G1
     Compute T and U points via scalar multiplication.
     
     This is a fallback when decompression isn't available.
-    T = secret·G, U = secret·Y
+    T = secret·G, U = secret·Y = 2·T (since Y = 2·G)
     """
-    G = G1Point.get_nG(CURVE_ID, 1)
-    Y = G.scalar_mul(2)  # Y = 2·G
-    
-    T = G.scalar_mul(secret_scalar)
-    U = Y.scalar_mul(secret_scalar)
+    T = _G_ED25519.scalar_mul(secret_scalar)
+    U = T.scalar_mul(2)  # one doubling instead of a second full scalar-mul
     
     return T, U
 
@@ -120,8 +115,8 @@ def generate_hints_with_actual_coordinates():
     print()
     
     # Get base points
-    G = G1Point.get_nG(CURVE_ID, 1)
-    Y = G.scalar_mul(2)  # Y = 2·G
+    G = _G_ED25519
+    Y = _Y_ED25519  # Y = 2·G
     
     # Extract scalars (matching Cairo's reduce_felt_to_scalar)
     # CRITICAL: Cairo's reduce_felt_to_scalar takes LOW 128 bits directly
@@ -134,8 +129,8 @@ def generate_hints_with_actual_coordinates():
     
     # Cairo's exact truncation: direct 128-bit truncation (matching reduce_felt_to_scalar)
     # felt252 max is ~252 bits, Cairo truncates to 128 bits directly
-    s_scalar = response_int & ((1 << 128) - 1)  # Direct 128-bit truncation
-    c_scalar = challenge_int & ((1 << 128) - 1)  # Direct 128-bit truncation
+    s_scalar = response_int & MASK_128  # Direct 128-bit truncation
+    c_scalar = challenge_int & MASK_128  # Direct 128-bit truncation
     c_neg_scalar = (ED25519_ORDER - c_scalar) % ED25519_ORDER
     
     print("Scalars (matching Cairo's reduce_felt_to_scalar):")